@@ -9,14 +9,130 @@ import socket
 import ssl
 import time
 import argparse
+import queue
+import select
 import sys
-from typing import Union, Tuple
+import threading
+from typing import Dict, List, Optional, Union, Tuple
+
+
+# CA file -> client SSL context; building one re-parses the certificate store
+_SSL_CTX_CACHE: Dict[str, ssl.SSLContext] = {}
+# CA file -> thread started by prewarm_ssl_context() to build its context
+_SSL_WARMUPS: Dict[str, threading.Thread] = {}
+_SSL_WARMUPS_LOCK = threading.Lock()
+# (server_address, server_port) -> TLS session of the last released connection,
+# offered by the next handshake so the server can resume it
+_SSL_SESSIONS: Dict[Tuple[str, int], ssl.SSLSession] = {}
+
+# Initial receive buffer for one response; grown if a response is longer
+RECV_BUFFER_SIZE = 4096
+# Per-thread receive buffer reused by every response read, see _recv_buffer()
+_RECV_BUFFERS = threading.local()
+# Seconds to wait for a connection, and then for each read or write on it
+SOCKET_TIMEOUT = 5.0
+# Linux only; see _iter_responses()
+_TCP_QUICKACK = getattr(socket, 'TCP_QUICKACK', None)
+
+# Idle connections kept per server by release_connection()
+POOL_SIZE = 8
+# (server_address, server_port, use_ssl) -> idle connections, most recent first
+_CONN_POOL: Dict[Tuple[str, int, bool], queue.LifoQueue] = {}
+_CONN_POOL_LOCK = threading.Lock()
 
 
 class CustomConnectionError(Exception):
     """Custom exception for connection-related errors."""
 
 
+def _get_ssl_context(cafile: str = 'cert.pem') -> ssl.SSLContext:
+    """
+    Return the shared client SSL context trusting the given CA file.
+
+    The context is created on first use and reused by every later connection,
+    so plain connections never pay for building one.
+
+    Args:
+        cafile (str): Path to the CA certificate used to verify the server.
+
+    Returns:
+        ssl.SSLContext: The cached client context.
+    """
+    context = _SSL_CTX_CACHE.get(cafile)
+    if context is None:
+        warmup = _SSL_WARMUPS.get(cafile)
+        if warmup is not None:
+            warmup.join()  # Wait only for what is left of the warmup
+            context = _SSL_CTX_CACHE.get(cafile)
+    if context is None:
+        context = _build_ssl_context(cafile)
+    return context
+
+
+def _build_ssl_context(cafile: str) -> ssl.SSLContext:
+    """
+    Build a client SSL context and cache it, keeping any built concurrently.
+
+    Args:
+        cafile (str): Path to the CA certificate used to verify the server.
+
+    Returns:
+        ssl.SSLContext: The cached client context.
+    """
+    context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    context.load_verify_locations(cafile)
+    return _SSL_CTX_CACHE.setdefault(cafile, context)
+
+
+def _warm_ssl_context(cafile: str) -> None:
+    """
+    Build the SSL context in the background, leaving errors to the first real use.
+
+    Args:
+        cafile (str): Path to the CA certificate used to verify the server.
+    """
+    try:
+        _build_ssl_context(cafile)
+    except (ssl.SSLError, OSError):
+        pass  # _get_ssl_context() retries and raises it to the caller
+
+
+def prewarm_ssl_context(cafile: str = 'cert.pem') -> None:
+    """
+    Start building the client SSL context on a background thread.
+
+    Loading the CA file takes long enough to be worth overlapping with other
+    startup work, such as reading the queries; the first SSL connection then
+    waits only for whatever is left of it.  Nothing is built at import time,
+    so plain connections still do no SSL work.
+
+    Args:
+        cafile (str): Path to the CA certificate used to verify the server.
+    """
+    with _SSL_WARMUPS_LOCK:
+        if cafile in _SSL_CTX_CACHE or cafile in _SSL_WARMUPS:
+            return
+        warmup = threading.Thread(target=_warm_ssl_context, args=(cafile,),
+                                  name='ssl-warmup', daemon=True)
+        _SSL_WARMUPS[cafile] = warmup
+        warmup.start()
+
+
+def _tune_socket(sock: socket.socket) -> None:
+    """
+    Set the TCP options used by every client connection.
+
+    Queries are tiny request/response exchanges, so Nagle's packet
+    coalescing only adds latency. Keepalive probes let a pooled connection
+    notice a peer that went away while it sat idle.
+
+    Args:
+        sock (socket.socket): The socket to configure.
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
 def create_ssl_socket(server_address: str, server_port: int) -> ssl.SSLSocket:
     """
     Create an SSL socket to connect to the server securely.
@@ -33,13 +149,19 @@ def create_ssl_socket(server_address: str, server_port: int) -> ssl.SSLSocket:
         ssl.SSLError: If an SSL-specific error occurs.
     """
     try:
-        context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        context.load_verify_locations('cert.pem')
-        plain_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        ssl_socket = context.wrap_socket(
-            plain_socket, server_hostname=server_address)
-        ssl_socket.connect((server_address, server_port))
-        return ssl_socket
+        # The context is built while the TCP handshake is in flight
+        prewarm_ssl_context()
+        plain_socket = socket.create_connection(
+            (server_address, server_port), timeout=SOCKET_TIMEOUT)
+        try:
+            # Set before wrapping so the SSL socket inherits them
+            _tune_socket(plain_socket)
+            return _get_ssl_context().wrap_socket(
+                plain_socket, server_hostname=server_address,
+                session=_SSL_SESSIONS.get((server_address, server_port)))
+        except BaseException:
+            plain_socket.close()
+            raise
     except ssl.SSLError as e:
         raise ssl.SSLError(f"SSL error occurred: {e}") from e
     except (socket.error, OSError) as e:
@@ -62,8 +184,14 @@ def create_plain_socket(server_address: str, server_port: int) -> socket.socket:
         CustomConnectionError: If unable to create or connect the socket.
     """
     try:
-        plain_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        plain_socket.connect((server_address, server_port))
+        # Resolves the address for IPv4 or IPv6 and bounds the connect time
+        plain_socket = socket.create_connection(
+            (server_address, server_port), timeout=SOCKET_TIMEOUT)
+        try:
+            _tune_socket(plain_socket)
+        except BaseException:
+            plain_socket.close()
+            raise
         return plain_socket
     except (socket.error, OSError) as e:
         raise CustomConnectionError(
@@ -91,13 +219,179 @@ def connect_to_server(use_ssl: bool, server_address: str, server_port: int) -> U
         raise CustomConnectionError(f"Failed to connect to server: {e}") from e
 
 
-def send_query(sock: Union[ssl.SSLSocket, socket.socket], query: str) -> str:
+def _is_connection_alive(sock: Union[ssl.SSLSocket, socket.socket]) -> bool:
+    """
+    Check whether an idle pooled connection can still be used.
+
+    An idle connection has nothing to read, so a readable socket means the
+    server closed it (or sent something unexpected).
+
+    Args:
+        sock (Union[ssl.SSLSocket, socket.socket]): The idle socket.
+
+    Returns:
+        bool: True if the connection looks usable.
+    """
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return False
+    return not readable
+
+
+def acquire_connection(use_ssl: bool, server_address: str, server_port: int) -> Union[ssl.SSLSocket, socket.socket]:
+    """
+    Take an idle pooled connection to the server, or open a new one.
+
+    Args:
+        use_ssl (bool): Whether to use SSL for the connection.
+        server_address (str): The server's address.
+        server_port (int): The server's port number.
+
+    Returns:
+        Union[ssl.SSLSocket, socket.socket]: A connected socket (SSL or plain).
+
+    Raises:
+        CustomConnectionError: If unable to connect to the server.
+    """
+    with _CONN_POOL_LOCK:
+        idle = _CONN_POOL.get((server_address, server_port, use_ssl))
+    while idle is not None:
+        try:
+            sock = idle.get_nowait()
+        except queue.Empty:
+            break
+        if _is_connection_alive(sock):
+            return sock
+        sock.close()
+    return connect_to_server(use_ssl, server_address, server_port)
+
+
+def release_connection(sock: Union[ssl.SSLSocket, socket.socket], use_ssl: bool,
+                       server_address: str, server_port: int) -> None:
+    """
+    Return a connection with no request in flight to the pool for reuse.
+
+    Args:
+        sock (Union[ssl.SSLSocket, socket.socket]): The socket to return.
+        use_ssl (bool): Whether the connection uses SSL.
+        server_address (str): The server's address.
+        server_port (int): The server's port number.
+    """
+    if isinstance(sock, ssl.SSLSocket):
+        # Read only now: TLS 1.3 delivers the resumable session ticket after
+        # the handshake, with the first response. The server closes idle
+        # connections, so the next handshake may well need it.
+        session = sock.session
+        if session is not None:
+            _SSL_SESSIONS[(server_address, server_port)] = session
+    with _CONN_POOL_LOCK:
+        idle = _CONN_POOL.setdefault((server_address, server_port, use_ssl),
+                                     queue.LifoQueue(maxsize=POOL_SIZE))
+    try:
+        idle.put_nowait(sock)
+    except queue.Full:
+        sock.close()
+
+
+def close_pooled_connections() -> None:
+    """Close every idle pooled connection."""
+    with _CONN_POOL_LOCK:
+        pools = list(_CONN_POOL.values())
+        _CONN_POOL.clear()
+    for idle in pools:
+        while True:
+            try:
+                idle.get_nowait().close()
+            except queue.Empty:
+                break
+            except (socket.error, OSError):
+                continue
+
+
+def _recv_buffer() -> bytearray:
+    """
+    Return the calling thread's reusable receive buffer.
+
+    Returns:
+        bytearray: A buffer of RECV_BUFFER_SIZE bytes.
+    """
+    buf = getattr(_RECV_BUFFERS, 'buf', None)
+    if buf is None:
+        buf = _RECV_BUFFERS.buf = bytearray(RECV_BUFFER_SIZE)
+    return buf
+
+
+def _iter_responses(sock: Union[ssl.SSLSocket, socket.socket], count: int,
+                    buf: Optional[bytearray] = None):
+    """
+    Yield the next count responses from the server as each one arrives.
+
+    Responses are read into a single buffer and split on their terminating
+    newline, so one read may complete several responses and one response
+    may span several reads.
+
+    Args:
+        sock (Union[ssl.SSLSocket, socket.socket]): The connected socket.
+        count (int): The number of responses to read.
+        buf (Optional[bytearray]): Buffer to receive into; defaults to the
+            calling thread's reusable buffer.
+
+    Yields:
+        str: Each response, including its trailing newline.
+
+    Raises:
+        CustomConnectionError: If the server closes the connection early.
+    """
+    if buf is None:
+        buf = _recv_buffer()
+    start = filled = 0  # Unread data is buf[start:filled]
+    while count:
+        newline = buf.find(b'\n', start, filled)
+        if newline < 0:
+            if start:
+                with memoryview(buf) as view:
+                    view[:filled - start] = view[start:filled]
+                filled -= start
+                start = 0
+            if filled == len(buf):
+                # Grow into a new buffer; a view may still pin the old one
+                buf = buf + bytearray(len(buf))
+            if _TCP_QUICKACK is not None:
+                # Acknowledge the response at once rather than after the
+                # delayed-ACK timer. Linux leaves quick-ACK mode on its own
+                # after a few segments, so setting it once at connect time
+                # would not cover later queries on a pooled connection.
+                sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+            with memoryview(buf) as view:
+                received = sock.recv_into(view[filled:])
+            if received:
+                filled += received
+                continue
+            if not filled:
+                raise CustomConnectionError("Server closed the connection")
+            newline = filled - 1  # Last response may lack the newline
+
+        response = buf[start:newline + 1].decode('utf-8')
+        start = newline + 1
+        count -= 1
+        yield response
+
+
+def send_query(sock: Union[ssl.SSLSocket, socket.socket], query: str,
+               buf: Optional[bytearray] = None) -> str:
     """
     Send a query to the server and return the response.
 
+    The response is read up to its terminating newline into a single buffer,
+    so a response spread over several segments is returned whole.  The
+    buffer is reused across calls rather than allocated per query.
+
     Args:
         sock (Union[ssl.SSLSocket, socket.socket]): The connected socket.
         query (str): The query string to send.
+        buf (Optional[bytearray]): Buffer to receive into; defaults to the
+            calling thread's reusable buffer.
 
     Returns:
         str: The server's response.
@@ -106,11 +400,8 @@ def send_query(sock: Union[ssl.SSLSocket, socket.socket], query: str) -> str:
         CustomConnectionError: If unable to send or receive data.
     """
     try:
-        sock.sendall(query.encode('utf-8'))
-        response = sock.recv(1024).decode('utf-8')
-        if not response:
-            raise CustomConnectionError("Server closed the connection")
-        return response
+        sock.sendall(query.encode('utf-8') + b'\n')
+        return next(_iter_responses(sock, 1, buf))
     except (socket.error, OSError) as e:
         raise CustomConnectionError(
             f"Error during communication with server: {e}") from e
@@ -130,33 +421,89 @@ def execute_query(sock: Union[ssl.SSLSocket, socket.socket], query: str) -> Tupl
     Raises:
         CustomConnectionError: If unable to send or receive data.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     response = send_query(sock, query)
-    end_time = time.time()
-    return response, end_time - start_time
+    return response, (time.perf_counter_ns() - start_ns) / 1e9
+
+
+def execute_queries(sock: Union[ssl.SSLSocket, socket.socket], queries: List[str]) -> List[Tuple[str, float]]:
+    """
+    Execute several queries in one write and measure when each response arrives.
+
+    The server answers query lines in order, so pipelining them costs a
+    single round trip for the whole batch instead of one per query.
+
+    Args:
+        sock (Union[ssl.SSLSocket, socket.socket]): The connected socket.
+        queries (List[str]): The query strings to send.
+
+    Returns:
+        List[Tuple[str, float]]: Each response with the time from sending
+        the batch until it arrived.
+
+    Raises:
+        CustomConnectionError: If unable to send or receive data.
+    """
+    if not queries:
+        return []
+    start_ns = time.perf_counter_ns()
+    try:
+        sock.sendall('\n'.join(queries).encode('utf-8') + b'\n')
+        return [(response, (time.perf_counter_ns() - start_ns) / 1e9)
+                for response in _iter_responses(sock, len(queries))]
+    except (socket.error, OSError) as e:
+        raise CustomConnectionError(
+            f"Error during communication with server: {e}") from e
+
+
+def query_server(use_ssl: bool, server_address: str, server_port: int, query: str) -> Tuple[str, float]:
+    """
+    Execute a query over a pooled connection and measure the time taken.
+
+    Args:
+        use_ssl (bool): Whether to use SSL for the connection.
+        server_address (str): The server's address.
+        server_port (int): The server's port number.
+        query (str): The query string to send.
 
+    Returns:
+        Tuple[str, float]: A tuple containing the response and the time taken.
 
-def main(server_address: str, server_port: int, use_ssl: bool, query: str) -> None:
+    Raises:
+        CustomConnectionError: If unable to connect, send or receive data.
+    """
+    sock = acquire_connection(use_ssl, server_address, server_port)
+    try:
+        result = execute_query(sock, query)
+    except BaseException:
+        # The connection state is unknown; never hand it out again
+        sock.close()
+        raise
+    release_connection(sock, use_ssl, server_address, server_port)
+    return result
+
+
+def main(server_address: str, server_port: int, use_ssl: bool, queries: List[str]) -> None:
     """
     Main function to run the client.
 
+    Queries reuse a pooled connection, so the TCP and SSL handshakes are
+    paid once rather than once per query.
+
     Args:
         server_address (str): The server's address.
         server_port (int): The server's port number.
         use_ssl (bool): Whether to use SSL for the connection.
-        query (str): The query string to send to the server.
+        queries (List[str]): The query strings to send to the server.
     """
-    sock = None
     try:
         print(f"[*] Connecting to server at {server_address}:{
               server_port} with SSL={'Yes' if use_ssl else 'No'}")
-        sock = connect_to_server(use_ssl, server_address, server_port)
-
-        print(f"[*] Sending query: {query}")
-        response, duration = execute_query(sock, query)
 
-        print(f"[*] Received response: {response.strip()}")
-        print(f"[*] Query took {duration:.4f} seconds")
+        for query in queries:
+            response, duration = query_server(
+                use_ssl, server_address, server_port, query)
+            print(f"[*] {query}: {response.strip()} ({duration:.4f} seconds)")
 
     except CustomConnectionError as e:
         print(f"Connection error: {e}", file=sys.stderr)
@@ -165,11 +512,7 @@ def main(server_address: str, server_port: int, use_ssl: bool, query: str) -> No
     except Exception as e:
         print(f"An unexpected error occurred: {e}", file=sys.stderr)
     finally:
-        if sock:
-            try:
-                sock.close()
-            except (socket.error, OSError) as e:
-                print(f"Error while closing socket: {e}", file=sys.stderr)
+        close_pooled_connections()
 
 
 if __name__ == "__main__":
@@ -181,8 +524,12 @@ if __name__ == "__main__":
                         default=44445, help="Server port to connect to")
     parser.add_argument("--use_ssl", action="store_true",
                         help="Use SSL for the connection")
-    parser.add_argument("--query", type=str, required=True,
-                        help="The string to search for in the server's file")
+    parser.add_argument("--query", type=str, action="append",
+                        help="A string to search for in the server's file; "
+                             "may be repeated. Read one per line from stdin if omitted")
     args = parser.parse_args()
 
-    main(args.server_address, args.server_port, args.use_ssl, args.query)
+    if args.use_ssl:
+        prewarm_ssl_context()  # Overlaps with reading the queries
+    queries = args.query or [line.strip() for line in sys.stdin if line.strip()]
+    main(args.server_address, args.server_port, args.use_ssl, queries)
@@ -0,0 +1,169 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled binary search over the sorted offset table used by server.LineTable.
+
+Build it in place with ``cythonize -i search_ext.pyx``. When the extension is
+not built, server.py falls back to bisect over the table.
+"""
+
+from cpython.buffer cimport PyBUF_SIMPLE, PyBuffer_Release, PyObject_GetBuffer
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_CheckExact, PyBytes_GET_SIZE
+from libc.stdlib cimport calloc, free
+from libc.string cimport memcmp
+
+
+cdef enum:
+    # Keys of the empty line, the 256 one-byte lines and the 65536 two-byte
+    # prefixes, numbered in the order their lines sort in
+    _PREFIX_KEYS = 1 + 256 * 257
+
+
+cdef inline bint _is_space(unsigned char c) noexcept nogil:
+    """Match the ASCII whitespace removed by bytes.strip()."""
+    return c == 32 or 9 <= c <= 13
+
+
+cdef inline Py_ssize_t _prefix_key(const unsigned char *line,
+                                   Py_ssize_t length) noexcept nogil:
+    """Number the line's first two bytes so that the numbering sorts like the lines."""
+    if length == 0:
+        return 0
+    if length == 1:
+        return 1 + line[0] * 257
+    return 2 + line[0] * 257 + line[1]
+
+
+cdef bint _search(const unsigned char *base,
+                  const unsigned long long *starts,
+                  const unsigned long long *ends,
+                  const unsigned char *target, Py_ssize_t target_len,
+                  Py_ssize_t low, Py_ssize_t high) noexcept nogil:
+    """Bisect lines [low, high) of the table for one equal to target."""
+    cdef Py_ssize_t mid, line_len
+    cdef int cmp
+
+    while low < high:
+        mid = (low + high) // 2
+        line_len = <Py_ssize_t>(ends[mid] - starts[mid])
+        cmp = memcmp(base + starts[mid], target,
+                     line_len if line_len < target_len else target_len)
+        if cmp == 0:
+            cmp = (line_len > target_len) - (line_len < target_len)
+        if cmp == 0:
+            return True
+        if cmp < 0:
+            low = mid + 1
+        else:
+            high = mid
+    return False
+
+
+cpdef bint binary_search(const unsigned char[::1] buffer,
+                         const unsigned long long[::1] starts,
+                         const unsigned long long[::1] ends,
+                         bytes query, Py_ssize_t low=0, Py_ssize_t high=-1):
+    """Return whether query equals one of the lines in [low, high), given sorted line offsets."""
+    cdef const unsigned char *base
+    cdef const unsigned char *target = <const unsigned char *>(<const char *>query)
+    cdef Py_ssize_t target_len = len(query)
+    cdef bint found
+
+    if high < 0 or high > starts.shape[0]:
+        high = starts.shape[0]
+    if low < 0:
+        low = 0
+    if low >= high:
+        return False
+    base = &buffer[0] if buffer.shape[0] else NULL
+    with nogil:
+        found = _search(base, &starts[0], &ends[0], target, target_len, low, high)
+    return found
+
+
+cdef class LineIndex:
+    """Sorted line offsets of a LineTable, searched by two-byte prefix.
+
+    Built once per table. It keeps the table's buffers exported for its
+    lifetime, so a lookup reads them through raw pointers rather than
+    acquiring memoryviews, and finds the run of lines sharing the query's
+    first two bytes in a flat array rather than a dict keyed by bytes.
+    """
+    cdef Py_buffer _buffer
+    cdef Py_buffer _starts
+    cdef Py_buffer _ends
+    cdef Py_ssize_t *_bounds  # Prefix key -> index of its first line
+
+    def __cinit__(self, buffer, starts, ends):
+        cdef const unsigned char *base
+        cdef const unsigned long long *line_starts
+        cdef const unsigned long long *line_ends
+        cdef Py_ssize_t count, index, key
+
+        PyObject_GetBuffer(buffer, &self._buffer, PyBUF_SIMPLE)
+        PyObject_GetBuffer(starts, &self._starts, PyBUF_SIMPLE)
+        PyObject_GetBuffer(ends, &self._ends, PyBUF_SIMPLE)
+        count = self._starts.len // sizeof(unsigned long long)
+        if self._ends.len != self._starts.len:
+            raise ValueError("starts and ends differ in length")
+        self._bounds = <Py_ssize_t *>calloc(_PREFIX_KEYS + 1, sizeof(Py_ssize_t))
+        if self._bounds == NULL:
+            raise MemoryError()
+
+        # Count the lines of each prefix, then sum the counts into start indexes
+        base = <const unsigned char *>self._buffer.buf
+        line_starts = <const unsigned long long *>self._starts.buf
+        line_ends = <const unsigned long long *>self._ends.buf
+        for index in range(count):
+            key = _prefix_key(base + line_starts[index],
+                              min(<Py_ssize_t>(line_ends[index] - line_starts[index]), 2))
+            self._bounds[key + 1] += 1
+        for key in range(1, _PREFIX_KEYS + 1):
+            self._bounds[key] += self._bounds[key - 1]
+
+    def __dealloc__(self):
+        free(self._bounds)
+        PyBuffer_Release(&self._buffer)
+        PyBuffer_Release(&self._starts)
+        PyBuffer_Release(&self._ends)
+
+    cdef bint _find(self, const unsigned char *target, Py_ssize_t length) noexcept:
+        cdef Py_ssize_t key = _prefix_key(target, length if length < 2 else 2)
+        return _search(<const unsigned char *>self._buffer.buf,
+                       <const unsigned long long *>self._starts.buf,
+                       <const unsigned long long *>self._ends.buf,
+                       target, length, self._bounds[key], self._bounds[key + 1])
+
+    def contains(self, line):
+        """Return whether line, bytes or another buffer, equals one of the lines."""
+        cdef Py_buffer view
+        cdef bint hit
+
+        if PyBytes_CheckExact(line):
+            return self._find(<const unsigned char *>PyBytes_AS_STRING(line),
+                              PyBytes_GET_SIZE(line))
+        PyObject_GetBuffer(line, &view, PyBUF_SIMPLE)
+        hit = self._find(<const unsigned char *>view.buf, view.len)
+        PyBuffer_Release(&view)
+        return hit
+
+    def respond(self, line, bytes found, bytes missing):
+        """Strip a raw query line, look it up and return found or missing.
+
+        Fuses the per-query steps of the server's hot path: surrounding
+        whitespace is skipped in place and the query is searched without
+        copying it.
+        """
+        cdef Py_buffer view
+        cdef const unsigned char *target
+        cdef Py_ssize_t first = 0, last
+        cdef bint hit
+
+        PyObject_GetBuffer(line, &view, PyBUF_SIMPLE)
+        target = <const unsigned char *>view.buf
+        last = view.len
+        while first < last and _is_space(target[first]):
+            first += 1
+        while last > first and _is_space(target[last - 1]):
+            last -= 1
+        hit = self._find(target + first, last - first)
+        PyBuffer_Release(&view)
+        return found if hit else missing
@@ -5,20 +5,66 @@ and performs binary search on a sorted file to find queried strings. It includes
 comprehensive error handling for improved reliability and debugging.
 """
 
+import os
+import asyncio
+import multiprocessing
+import multiprocessing.synchronize
+import selectors
 import socket
 import threading
+from bisect import bisect_left
 import ssl
 import configparser
 import logging
-from typing import Tuple, List, Optional
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Set, Tuple, Optional
 import sys
 import time
 
+try:
+    import uvloop  # type: ignore[import-not-found]
+except ImportError:  # uvloop is optional; fall back to the default event loop
+    uvloop = None  # type: ignore[assignment]
+
+try:
+    import search_ext  # type: ignore[import-not-found]
+except ImportError:  # search_ext.pyx is optional; LineTable falls back to a hash index
+    search_ext = None
+
+try:
+    import xxhash  # type: ignore[import-not-found]
+except ImportError:  # xxhash is optional; line fingerprints fall back to hash()
+    xxhash = None  # type: ignore[assignment]
+
 # Set up logging
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrently served TLS connections; plain ones share one thread
+MAX_CLIENT_WORKERS = 64
+# Longest accepted query line, including the trailing newline
+MAX_QUERY_LENGTH = 4096
+# Seconds shutdown() waits for connections to drain
+SHUTDOWN_TIMEOUT = 5.0
+# Seconds a pool worker waits for a TLS client to complete its handshake
+TLS_HANDSHAKE_TIMEOUT = 5.0
+# Seconds a TLS connection may sit idle before it is closed to free its
+# worker; below the client's own 5 second timeout, so a connection queued
+# behind a pool full of idle ones is still served before the client gives up
+CLIENT_IDLE_TIMEOUT = 3.0
+
+# Fingerprints LineTable's hash index with; hash() is seeded per process,
+# which is fine since the index never leaves the process that built it
+_line_hash = xxhash.xxh3_64_intdigest if xxhash is not None else hash
+
+_RESP_YES = b"STRING EXISTS\n"
+_RESP_NO = b"STRING NOT FOUND\n"
+# Indexed by the lookup result: False -> not found, True -> exists
+_RESPONSES = (_RESP_NO, _RESP_YES)
+
 
 class ConfigError(Exception):
     """Custom exception for configuration-related errors."""
@@ -33,16 +79,28 @@ class ServerError(Exception):
 
 
 class ServerConfig:
-    """Handle server configuration settings."""
+    """Handle server configuration settings.
+
+    The file is read once and its values stored as plain attributes, which
+    the request path reads on every query; slots keep those reads off an
+    instance dictionary.
+    """
+
+    __slots__ = ('file_path', 'reread_on_query', 'use_ssl', 'use_asyncio')
+
+    file_path: str
+    reread_on_query: bool
+    use_ssl: bool
+    use_asyncio: bool
 
     def __init__(self, config_path: str):
         try:
-            self.file_path, self.reread_on_query, self.use_ssl = self._read_config(
-                config_path)
+            (self.file_path, self.reread_on_query, self.use_ssl,
+             self.use_asyncio) = self._read_config(config_path)
         except configparser.Error as e:
             raise ConfigError(f"Failed to read configuration: {e}") from e
 
-    def _read_config(self, config_path: str) -> Tuple[str, bool, bool]:
+    def _read_config(self, config_path: str) -> Tuple[str, bool, bool, bool]:
         """Read configuration settings from the config file."""
         config = configparser.ConfigParser()
         config.read(config_path)
@@ -50,7 +108,8 @@ class ServerConfig:
             return (
                 config.get('DEFAULT', 'linuxpath'),
                 config.getboolean('DEFAULT', 'REREAD_ON_QUERY'),
-                config.getboolean('DEFAULT', 'use_ssl')
+                config.getboolean('DEFAULT', 'use_ssl'),
+                config.getboolean('DEFAULT', 'use_asyncio', fallback=False)
             )
         except configparser.NoSectionError as e:
             raise ConfigError(
@@ -59,135 +118,554 @@ class ServerConfig:
             raise ConfigError(f"Missing option in config file: {e}") from e
 
 
+class LineTable(Sequence):
+    """Sorted, read-only view of a file's lines backed by a single buffer.
+
+    Rather than one Python object per line, the lines stay in the original
+    buffer and the table stores the start and end offset of each line in
+    sorted order, 16 bytes per line in two C arrays.  Indexing returns the
+    line as bytes, so the table can be searched with bisect directly.  Lines
+    end at each newline, not counting a carriage return before it.
+
+    With the compiled search_ext, lookups go to a search_ext.LineIndex built
+    over the offsets, which narrows the binary search to the run of lines
+    sharing the query's first two bytes.  Without it, membership is answered from a
+    dict of 64-bit line fingerprints, with a single comparison confirming a
+    fingerprint match.
+    """
+
+    def __init__(self, buffer: bytes):
+        self._buffer = buffer
+        # One scan for the line offsets, in file order
+        starts = array('Q')
+        ends = array('Q')
+        size = len(buffer)
+        start = 0
+        while start < size:
+            newline = buffer.find(b"\n", start)
+            if newline < 0:
+                newline = size  # The last line may lack the newline
+            end = newline
+            if end > start and buffer[end - 1] == 0x0d:  # CRLF line ending
+                end -= 1
+            starts.append(start)
+            ends.append(end)
+            start = newline + 1
+
+        # Sort keys; like the index structures below, only needed while building
+        lines = [buffer[start:end] for start, end in zip(starts, ends)]
+        order = sorted(range(len(lines)), key=lines.__getitem__)
+        self._starts = array('Q', [starts[i] for i in order])
+        self._ends = array('Q', [ends[i] for i in order])
+
+        self._index: Any = None  # The compiled search_ext.LineIndex
+        # Fingerprint -> index of the line with it, or -1 if distinct lines share it
+        self._fingerprints: Optional[Dict[int, int]] = None
+        if search_ext is not None:
+            self._index = search_ext.LineIndex(buffer, self._starts, self._ends)
+        else:
+            self._build_hash_index(lines, order)
+
+    def _build_hash_index(self, lines, order) -> None:
+        """Index each distinct line by fingerprint."""
+        fingerprints: Dict[int, int] = {}
+        previous = None
+        for index, i in enumerate(order):
+            line = lines[i]
+            if line == previous:
+                continue  # Duplicate lines are adjacent once sorted
+            previous = line
+            fingerprint = _line_hash(line)
+            # A shared fingerprint is left for the binary search to settle
+            fingerprints[fingerprint] = -1 if fingerprint in fingerprints else index
+        self._fingerprints = fingerprints
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._buffer[self._starts[index]:self._ends[index]]
+
+    def __contains__(self, line) -> bool:
+        fingerprints = self._fingerprints
+        if fingerprints is None:
+            return self._index.contains(line)
+        index = fingerprints.get(_line_hash(line))
+        if index is None:
+            return False
+        if index >= 0:
+            return self[index] == line
+        index = bisect_left(self, line)
+        return index != len(self) and self[index] == line
+
+    def respond(self, line, found: bytes, missing: bytes) -> bytes:
+        """Strip a raw query line and return found if the table contains it, else missing."""
+        if self._index is not None:
+            return self._index.respond(line, found, missing)
+        return found if bytes(line).strip() in self else missing
+
+
+class ClientState:
+    """Buffers of a plain connection served by the selector loop in TCPServer.start()."""
+
+    def __init__(self, client_socket: socket.socket, address):
+        self.sock = client_socket
+        self.address = address
+        self.inbuf = bytearray()  # Received bytes not yet answered
+        self.outbuf = bytearray()  # Responses the socket has not taken yet
+        self.closing = False  # Close once outbuf is flushed
+
+
 class TCPServer:
     """Manage TCP server operations."""
 
     def __init__(self, config: ServerConfig):
         self.config = config
-        self.file_content: Optional[List[str]] = None
+        self.file_content: Optional[LineTable] = None
+        # (path, st_mtime_ns, st_size) the cached content was read from
+        self._cache_key: Optional[Tuple[str, int, int]] = None
+        self._cache_lock = threading.Lock()
+        # path -> (st_mtime_ns, st_size, contents) for the reread-on-query path
+        self._file_bytes: Dict[str, Tuple[int, int, bytes]] = {}
         self.server_socket: Optional[socket.socket] = None
         self.running = False
         self.stop_event = threading.Event()  # Event to signal the server to stop
-        self.client_threads = []  # List to keep track of client threads
+        self._pool = ThreadPoolExecutor(
+            max_workers=MAX_CLIENT_WORKERS, thread_name_prefix='client')
+        self._accepted = 0  # Connections accepted, for sampled logging
+        # Sockets being served, so shutdown() can unblock their recv()
+        self._client_sockets: Set[socket.socket] = set()
+        self._client_lock = threading.Lock()
+        self._clients_drained = threading.Event()  # Set while none are served
+        self._clients_drained.set()
+        # Wakes the selector loop in start() so it notices shutdown()
+        self._wakeup_socket: Optional[socket.socket] = None
+        # Set by shutdown() to stop the processes forked by start(num_workers)
+        self._workers_stop: Optional[multiprocessing.synchronize.Event] = None
+        # Event loop state, only used when serving with serve_async()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_stop: Optional[asyncio.Event] = None
+        self._async_writers: Set[asyncio.StreamWriter] = set()
+        # Built once so certificates are not re-parsed on every connection
+        self._ssl_context: Optional[ssl.SSLContext] = (
+            self._create_ssl_context() if config.use_ssl else None)
 
     def shutdown(self) -> None:
         """Shutdown the server by closing the listening socket and terminating active connections."""
         self.running = False
         self.stop_event.set()
-        if self.server_socket:
-            self.server_socket.close()
+        self._close_server_socket()
+        with self._client_lock:
+            for client_socket in self._client_sockets:
+                try:
+                    client_socket.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass  # Already disconnected
+        if self._workers_stop is not None:
+            self._workers_stop.set()
+        wakeup_socket = self._wakeup_socket
+        if wakeup_socket is not None:
+            try:
+                wakeup_socket.send(b"\0")
+            except OSError:
+                pass  # The selector loop has already exited
+        # Read once: serve_async() clears both when its loop finishes
+        loop, async_stop = self._loop, self._async_stop
+        if loop is not None and async_stop is not None:
+            try:
+                loop.call_soon_threadsafe(async_stop.set)
+            except RuntimeError:
+                pass  # The event loop has already closed
+
+        # Drop handlers still queued in the pool; one a worker picks up in
+        # the meantime sees stop_event and closes its socket. Wait only for
+        # those already serving.
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if not self._clients_drained.wait(SHUTDOWN_TIMEOUT):
+            logger.warning("Connections still open after %.1f seconds",
+                           SHUTDOWN_TIMEOUT)
+
+        if self._ssl_context is not None:
+            stats = self._ssl_context.session_stats()
+            logger.info("TLS sessions resumed: %d of %d handshakes",
+                        stats['hits'], stats['accept'])
+        logger.info("Server shutdown successfully.")
 
-        # Wait for all client threads to finish
-        for thread in self.client_threads:
-            thread.join()
+    def start(self, num_workers: int = 1) -> None:
+        """Start the TCP server to listen for incoming connections.
+
+        Plain connections are multiplexed on this thread with a selector, so
+        a connection costs a buffer rather than a thread.  TLS connections
+        are handed to the worker pool, where the handshake and reads block.
+        With use_asyncio set, serve_async() serves all clients instead.
+
+        With more than one worker, the port is bound here and that many
+        processes are forked to accept connections on the shared socket;
+        this call then returns once all have stopped.
+        """
+        serve = self._serve_event_loop if self.config.use_asyncio else self._serve
+        if num_workers > 1 and hasattr(os, 'fork'):
+            self._start_workers(num_workers, serve)
+        else:
+            serve()
+
+    def _start_workers(self, num_workers: int,
+                       target: Callable[[socket.socket], None]) -> None:
+        """Fork worker processes that each run target on the listening socket until shutdown()."""
+        self.running = True
+        self.preload()
+        # Bound once, before forking, so a port already in use fails here
+        # rather than being shared with another server
+        with self._listen() as server_socket:
+            context = multiprocessing.get_context('fork')
+            self._workers_stop = context.Event()
+            processes = [context.Process(target=self._run_worker,
+                                         args=(target, server_socket, self._workers_stop))
+                         for _ in range(num_workers)]
+            for process in processes:
+                process.start()
+            logger.info("[*] Started %d worker processes", num_workers)
+            try:
+                for process in processes:
+                    process.join()
+            except KeyboardInterrupt:
+                # Ctrl+C reaches every worker in the process group as well
+                self.shutdown()
+                for process in processes:
+                    process.join()
+
+    def _run_worker(self, target: Callable[[socket.socket], None],
+                    server_socket: socket.socket,
+                    stop: multiprocessing.synchronize.Event) -> None:
+        """Serve in a forked worker until the parent's shutdown() sets stop."""
+        server_thread = threading.Thread(target=target, args=(server_socket,))
+        server_thread.start()
+        try:
+            stop.wait()
+        except KeyboardInterrupt:
+            pass  # Ctrl+C reaches every worker in the process group
+        self.shutdown()
+        server_thread.join()
+
+    def preload(self) -> None:
+        """Parse the file before forking, so workers share it copy-on-write."""
+        if self.config.reread_on_query:
+            return
+        try:
+            self.get_cached_file_content()
+        except FileError:
+            pass  # Logged already; each query reports it to the client
 
-        logger.info("Server shutdown successfully.")
+    def _listen(self) -> socket.socket:
+        """Bind the server port and return the listening socket."""
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server_socket.bind(('0.0.0.0', 44445))
+            server_socket.listen(5)
+        except socket.error as e:
+            server_socket.close()
+            raise ServerError("Failed to start server") from e
+        logger.info("[*] Server listening on port 44445")
+        return server_socket
+
+    def _serve(self, server_socket: Optional[socket.socket] = None) -> None:
+        """Accept and serve connections on this thread until shutdown().
 
-    def start(self) -> None:
-        """Start the TCP server to listen for incoming connections."""
+        The port is bound here unless a forked worker passes the listening
+        socket it inherited.
+        """
+        if server_socket is None:
+            server_socket = self._listen()
         self.running = True
+        selector = selectors.DefaultSelector()
+        wakeup_recv, self._wakeup_socket = socket.socketpair()
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_socket:
+            with server_socket:
                 self.server_socket = server_socket  # Keep a reference for shutting down
-                server_socket.setsockopt(
-                    socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                server_socket.bind(('0.0.0.0', 44445))
-                server_socket.listen(5)
-                logger.info("[*] Server listening on port 44445")
+                server_socket.setblocking(False)
+                wakeup_recv.setblocking(False)
+                selector.register(server_socket, selectors.EVENT_READ)
+                selector.register(wakeup_recv, selectors.EVENT_READ)
+                # Shared by every connection; only this thread reads into it
+                scratch = memoryview(bytearray(MAX_QUERY_LENGTH))
 
                 while self.running:
-                    try:
-                        # Set a timeout for accept()
-                        server_socket.settimeout(1.0)
-                        try:
-                            client_socket, addr = server_socket.accept()
-                        except socket.timeout:
-                            continue  # No connection received, check if we should keep running
-
-                        logger.info("[*] Accepted connection from %s", addr)
-
-                        if self.config.use_ssl:
-                            try:
-                                client_socket = self.wrap_socket_with_ssl(
-                                    client_socket)
-                            except ssl.SSLError as ssl_error:
-                                logger.error("SSL error occurred: %s",
-                                             ssl_error, exc_info=True)
-                                client_socket.close()
-                                continue
-
-                        client_handler = threading.Thread(
-                            target=self.handle_client,
-                            args=(client_socket,)
-                        )
-                        self.client_threads.append(client_handler)
-                        client_handler.start()
-                    except socket.error as e:
-                        if not self.running:
-                            break  # Exit if server is shutting down
-                        logger.error("Error accepting connection: %s",
-                                     e, exc_info=True)
+                    for key, events in selector.select():
+                        if key.data is not None:
+                            self._service_client(selector, key, events, scratch)
+                        elif key.fileobj is server_socket:
+                            self._accept_clients(server_socket, selector)
+                        # Otherwise shutdown() woke the loop to exit
         except socket.error as e:
             raise ServerError("Failed to start server") from e
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.data is not None:
+                    self._close_client(selector, key.data)
+            selector.close()
+            wakeup_socket, self._wakeup_socket = self._wakeup_socket, None
+            wakeup_socket.close()
+            wakeup_recv.close()
+
+    def _accept_clients(self, server_socket: socket.socket,
+                        selector: selectors.BaseSelector) -> None:
+        """Accept every pending connection on the non-blocking listening socket."""
+        while self.running:
+            try:
+                client_socket, addr = server_socket.accept()
+            except BlockingIOError:
+                return
+            except socket.error as e:
+                if self.running:  # Otherwise shutdown() closed the socket
+                    logger.error("Error accepting connection: %s",
+                                 e, exc_info=True)
+                return
+
+            self._log_accept(addr)
+            try:
+                # Responses are single small writes; don't let Nagle hold
+                # them back waiting for the client's delayed ACK.
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                # Reclaim connections whose client vanished without closing
+                client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                # TLS connections block on a pool thread, plain ones stay here
+                client_socket.setblocking(self.config.use_ssl)
+                if not self.config.use_ssl:
+                    selector.register(client_socket, selectors.EVENT_READ,
+                                      ClientState(client_socket, addr))
+            except OSError as e:
+                # Only this connection is lost; keep accepting the others
+                logger.error("Error setting up connection from %s: %s",
+                             addr, e, exc_info=True)
+                client_socket.close()
+                continue
+
+            if not self.config.use_ssl:
+                self._track_client(client_socket)
+                continue
+            try:
+                self._pool.submit(self._handle_tls_client, client_socket)
+            except RuntimeError:
+                # The pool was shut down while this connection was accepted
+                client_socket.close()
+                return
+
+    def _service_client(self, selector: selectors.BaseSelector, key: selectors.SelectorKey,
+                        events: int, scratch: memoryview) -> None:
+        """Read, answer and flush a ready connection in the selector loop."""
+        state: ClientState = key.data
+        try:
+            if events & selectors.EVENT_READ:
+                try:
+                    received = state.sock.recv_into(scratch)
+                except BlockingIOError:
+                    received = None
+                if received:
+                    state.inbuf += scratch[:received]
+                elif received == 0:
+                    state.closing = True
+                    if state.inbuf:
+                        state.inbuf += b"\n"  # Last query may lack the newline
+
+                state.outbuf += self.process_requests(state.inbuf)
+                if len(state.inbuf) >= MAX_QUERY_LENGTH:
+                    logger.error("Query from %s exceeds %d bytes, closing connection",
+                                 state.address, MAX_QUERY_LENGTH)
+                    self._close_client(selector, state)
+                    return
+
+            if state.outbuf:
+                try:
+                    sent = state.sock.send(state.outbuf)
+                except BlockingIOError:
+                    sent = 0
+                del state.outbuf[:sent]
+        except socket.error as e:
+            logger.error("Error communicating with client %s: %s",
+                         state.address, e, exc_info=True)
+            self._close_client(selector, state)
+            return
+        except Exception as e:
+            # Contained to this connection so the loop keeps serving the rest
+            logger.error("Unexpected error handling client %s: %s",
+                         state.address, e, exc_info=True)
+            self._close_client(selector, state)
+            return
+
+        if state.closing and not state.outbuf:
+            self._close_client(selector, state)
+            return
+        # Stop reading while a response is still queued, so a client that
+        # pipelines without reading cannot grow the buffer without bound
+        wanted = selectors.EVENT_WRITE if state.outbuf else selectors.EVENT_READ
+        if key.events != wanted:
+            selector.modify(state.sock, wanted, state)
+
+    def _close_client(self, selector: selectors.BaseSelector, state: ClientState) -> None:
+        """Stop watching a selector-served connection and close it."""
+        selector.unregister(state.sock)
+        self._untrack_client(state.sock)
+        state.sock.close()
+        logger.debug("[*] Closed connection from %s", state.address)
+
+    def process_requests(self, buffer: bytearray) -> bytes:
+        """Answer every complete query line in the buffer, removing them from it."""
+        responses = []
+        start = 0
+        with memoryview(buffer) as view:
+            newline = buffer.find(b"\n")
+            while newline >= 0:
+                responses.append(self.build_response(view[start:newline]))
+                start = newline + 1
+                newline = buffer.find(b"\n", start)
+        del buffer[:start]
+        return b"".join(responses)
+
+    def _track_client(self, client_socket: socket.socket) -> None:
+        """Register a connection so shutdown() can disconnect and wait for it."""
+        with self._client_lock:
+            self._client_sockets.add(client_socket)
+            self._clients_drained.clear()
+
+    def _untrack_client(self, client_socket: socket.socket) -> None:
+        """Forget a finished connection, signalling shutdown() once none remain."""
+        with self._client_lock:
+            self._client_sockets.discard(client_socket)
+            if not self._client_sockets:
+                self._clients_drained.set()
+
+    def _log_accept(self, addr) -> None:
+        """Log accepted connections, at INFO only for every 256th one."""
+        if self._accepted & 0xff == 0:
+            logger.info("[*] Accepted connection from %s (%d accepted so far)",
+                        addr, self._accepted + 1)
+        else:
+            logger.debug("[*] Accepted connection from %s", addr)
+        self._accepted += 1
 
     def close(self) -> None:
         """Close the server and stop accepting new connections."""
         self.stop_event.set()
-        if self.server_socket:
-            self.server_socket.close()
+        if self._close_server_socket():
             logger.info("[*] Server socket closed")
 
-    def wrap_socket_with_ssl(self, client_socket: socket.socket) -> ssl.SSLSocket:
-        """Wrap a socket with SSL for secure communication."""
+    def _close_server_socket(self) -> bool:
+        """Close the listening socket.
+
+        It is not shut down: forked workers share it, and shutting it down
+        would stop it listening in every process.
+        """
+        if not self.server_socket:
+            return False
+        self.server_socket.close()
+        return True
+
+    def _create_ssl_context(self) -> ssl.SSLContext:
+        """Create the server-side SSL context and load the certificate chain."""
         try:
             context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
             context.load_cert_chain(certfile='cert.pem', keyfile='key.pem')
-            return context.wrap_socket(client_socket, server_side=True)
+            # Let returning clients resume their session instead of paying for
+            # a full handshake: TLS 1.3 via session tickets, TLS 1.2 via the
+            # OpenSSL server session cache, which is on by default and keyed
+            # by the session id context the ssl module sets. TLS 1.3 then
+            # negotiates TLS_AES_128_GCM_SHA256 or a stronger AEAD suite.
+            context.minimum_version = ssl.TLSVersion.TLSv1_2
+            context.options &= ~ssl.OP_NO_TICKET
+            return context
         except (ssl.SSLError, FileNotFoundError) as e:
+            raise ServerError("Failed to create SSL context") from e
+
+    def wrap_socket_with_ssl(self, client_socket: socket.socket) -> ssl.SSLSocket:
+        """Wrap a socket with SSL for secure communication."""
+        if self._ssl_context is None:
+            self._ssl_context = self._create_ssl_context()
+        try:
+            return self._ssl_context.wrap_socket(client_socket, server_side=True)
+        except ssl.SSLError as e:
             raise ServerError("Failed to wrap socket with SSL") from e
 
+    def _handle_tls_client(self, client_socket: socket.socket) -> None:
+        """Complete the TLS handshake on a pool thread, then serve the connection."""
+        # Tracked during the handshake so shutdown() can abort a stalled one
+        self._track_client(client_socket)
+        if self.stop_event.is_set():
+            # Queued before shutdown(), which has already disconnected the rest
+            self._untrack_client(client_socket)
+            client_socket.close()
+            return
+        # A silent peer must not hold the worker
+        client_socket.settimeout(TLS_HANDSHAKE_TIMEOUT)
+        try:
+            tls_socket = self.wrap_socket_with_ssl(client_socket)
+        except (ServerError, OSError) as ssl_error:
+            logger.error("SSL error occurred: %s", ssl_error, exc_info=True)
+            client_socket.close()
+            return
+        finally:
+            self._untrack_client(client_socket)
+        # Idle clients, such as those keeping a connection pooled for
+        # reuse, must not hold every worker
+        tls_socket.settimeout(CLIENT_IDLE_TIMEOUT)
+        self.handle_client(tls_socket)
+
     def handle_client(self, client_socket: socket.socket) -> None:
         """Handle each client connection, receiving data and sending responses."""
         client_address = client_socket.getpeername()
+        self._track_client(client_socket)
+        # Queries are newline-terminated. They are received into one reusable
+        # buffer, which reassembles lines split across segments and serves
+        # pipelined ones without allocating per recv()
+        buffer = bytearray(MAX_QUERY_LENGTH)
+        view = memoryview(buffer)
+        start = filled = 0  # Unprocessed data is buffer[start:filled]
         try:
             while not self.stop_event.is_set():
                 try:
-                    client_socket.settimeout(1.0)  # Set a timeout for recv()
-                    try:
-                        data = client_socket.recv(1024).decode('utf-8').strip()
-                    except socket.timeout:
-                        continue  # No data received, check if we should keep running
-
-                    if not data:
-                        logger.info(
-                            "[*] No data received from %s, closing connection", client_address)
+                    eof = False
+                    newline = buffer.find(b"\n", start, filled)
+                    if newline < 0:
+                        if start:
+                            view[:filled - start] = view[start:filled]
+                            filled -= start
+                            start = 0
+                        if filled == len(buffer):
+                            logger.error("Query from %s exceeds %d bytes, closing connection",
+                                         client_address, MAX_QUERY_LENGTH)
+                            break
+                        # Blocks until data arrives; shutdown() unblocks it by
+                        # shutting the socket down, which reads as end of stream
+                        received = client_socket.recv_into(view[filled:])
+                        if received:
+                            filled += received
+                            continue
+                        if not filled:
+                            logger.debug(
+                                "[*] No data received from %s, closing connection", client_address)
+                            break
+                        newline, eof = filled, True  # Last query may lack the newline
+
+                    data = bytes(view[start:newline]).strip()
+                    start = newline + 1
+
+                    logger.debug("[*] Received query from %s: %s",
+                                 client_address, data)
+
+                    response = self.build_response(data)
+
+                    logger.debug("[*] Sending response to %s: %r",
+                                 client_address, response)
+                    client_socket.sendall(response)
+                    if eof:
                         break
-
-                    logger.info("[*] Received query from %s: %s",
-                                client_address, data)
-
-                    try:
-                        lines = (
-                            self.read_file(self.config.file_path)
-                            if self.config.reread_on_query
-                            else self.get_cached_file_content()
-                        )
-                    except FileError as e:
-                        logger.error("File error: %s", e, exc_info=True)
-                        response = f"ERROR: {str(e)}\n"
-                        client_socket.sendall(response.encode('utf-8'))
-                        continue
-
-                    response = (
-                        "STRING EXISTS\n"
-                        if self.binary_search(lines, data)
-                        else "STRING NOT FOUND\n"
-                    )
-
-                    logger.info("[*] Sending response to %s: %s",
-                                client_address, response.strip())
-                    client_socket.sendall(response.encode('utf-8'))
-                except (socket.error, UnicodeDecodeError) as e:
+                except socket.timeout:
+                    logger.debug("[*] Connection from %s idle for %.1f seconds, closing it",
+                                 client_address, CLIENT_IDLE_TIMEOUT)
+                    break
+                except socket.error as e:
                     logger.error("Error communicating with client %s: %s",
                                  client_address, e, exc_info=True)
                     break
@@ -195,63 +673,236 @@ class TCPServer:
             logger.error("Unexpected error handling client %s: %s",
                          client_address, e, exc_info=True)
         finally:
+            view.release()
+            self._untrack_client(client_socket)
             client_socket.close()
-            logger.info("[*] Closed connection from %s", client_address)
+            logger.debug("[*] Closed connection from %s", client_address)
+
+    def _serve_event_loop(self, server_socket: Optional[socket.socket] = None) -> None:
+        """Run serve_async() on a new event loop until shutdown()."""
+        asyncio.run(self.serve_async(server_socket), loop_factory=(
+            uvloop.new_event_loop if uvloop is not None else None))
+
+    async def serve_async(self, server_socket: Optional[socket.socket] = None) -> None:
+        """Serve clients from a single asyncio event loop until shutdown() is called.
+
+        The port is bound here unless a forked worker passes the listening
+        socket it inherited.
+        """
+        if self.config.use_ssl and self._ssl_context is None:
+            self._ssl_context = self._create_ssl_context()
+        self._async_stop = async_stop = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        if self.stop_event.is_set():
+            async_stop.set()  # shutdown() ran before the loop was published
+        try:
+            if server_socket is None:
+                server_socket = self._listen()
+            try:
+                server = await asyncio.start_server(
+                    self.handle_client_async, sock=server_socket,
+                    ssl=self._ssl_context if self.config.use_ssl else None,
+                    limit=MAX_QUERY_LENGTH)
+            except OSError as e:
+                server_socket.close()
+                raise ServerError("Failed to start server") from e
+
+            async with server:
+                await async_stop.wait()
+                # Server.wait_closed() waits for open connections as well
+                for writer in list(self._async_writers):
+                    writer.close()
+        finally:
+            self._loop = None
+            self._async_stop = None
+
+    async def handle_client_async(self, reader: asyncio.StreamReader,
+                                  writer: asyncio.StreamWriter) -> None:
+        """Handle a client connection on the event loop, mirroring handle_client."""
+        client_address = writer.get_extra_info('peername')
+        self._log_accept(client_address)
+        self._async_writers.add(writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    line = e.partial  # Last query may lack the newline
+                if not line:
+                    logger.debug(
+                        "[*] No data received from %s, closing connection", client_address)
+                    break
+
+                data = line.strip()
+                logger.debug("[*] Received query from %s: %s",
+                             client_address, data)
+                response = self.build_response(data)
+                logger.debug("[*] Sending response to %s: %r",
+                             client_address, response)
+                writer.write(response)
+                await writer.drain()
+        except asyncio.LimitOverrunError:
+            logger.error("Query from %s exceeds %d bytes, closing connection",
+                         client_address, MAX_QUERY_LENGTH)
+        except OSError as e:
+            logger.error("Error communicating with client %s: %s",
+                         client_address, e, exc_info=True)
+        finally:
+            self._async_writers.discard(writer)
+            writer.close()
+            logger.debug("[*] Closed connection from %s", client_address)
+
+    def build_response(self, query) -> bytes:
+        """Look up the query, ignoring surrounding whitespace, and return the response line.
+
+        The query may be a memoryview into a receive buffer; the cached path
+        then strips and searches it without copying.
+        """
+        try:
+            if self.config.reread_on_query:
+                return _RESPONSES[self.search_file(
+                    self.config.file_path, bytes(query).strip())]
+            return self.get_cached_file_content().respond(query, _RESP_YES, _RESP_NO)
+        except FileError as e:
+            logger.error("File error: %s", e, exc_info=True)
+            return f"ERROR: {str(e)}\n".encode('utf-8')
+
+    def read_file(self, file_path: str) -> LineTable:
+        """Read the file and return its lines as a sorted, buffer-backed sequence."""
+        try:
+            # A private copy rather than a mapping: the file may be edited in
+            # place while the table is still serving queries
+            with open(file_path, 'rb') as file:
+                return LineTable(file.read())
+        except FileNotFoundError as exc:
+            raise FileError("File not found: %s" % file_path) from exc
+        except OSError as e:
+            raise FileError("Error reading file %s: %s" %
+                            (file_path, e)) from e
 
-    def read_file(self, file_path: str) -> List[str]:
-        """Read the contents of the file and return as a list of lines."""
+    def _get_file_bytes(self, file_path: str) -> bytes:
+        """Return the file's contents, reading them again when the file changes on disk."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read().splitlines()
+            stat = os.stat(file_path)
         except FileNotFoundError as exc:
             raise FileError("File not found: %s" % file_path) from exc
-        except IOError as e:
+        except OSError as e:
             raise FileError("Error reading file %s: %s" %
                             (file_path, e)) from e
+        cached = self._file_bytes.get(file_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
 
-    def get_cached_file_content(self) -> List[str]:
-        """Get cached file content or read it if not already cached."""
-        if self.file_content is None:
-            try:
-                self.file_content = sorted(
-                    self.read_file(self.config.file_path))
-            except FileError as e:
-                logger.error("Error caching file content: %s",
-                             e, exc_info=True)
-                raise
-        return self.file_content
-
-    def binary_search(self, sorted_lines: List[str], query: str) -> bool:
-        """Perform binary search to determine if the query string exists in the sorted list."""
-        low, high = 0, len(sorted_lines) - 1
-        while low <= high:
-            mid = (low + high) // 2
-            if sorted_lines[mid] == query:
+        try:
+            # A private copy rather than a mapping, as in read_file(): the
+            # file may be rewritten in place while a query is searching it
+            with open(file_path, 'rb') as file:
+                stat = os.fstat(file.fileno())
+                data = file.read()
+        except FileNotFoundError as exc:
+            raise FileError("File not found: %s" % file_path) from exc
+        except OSError as e:
+            raise FileError("Error reading file %s: %s" %
+                            (file_path, e)) from e
+        self._file_bytes[file_path] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
+
+    def search_file(self, file_path: str, target: bytes) -> bool:
+        """Search the raw file bytes for a line exactly matching the target."""
+        data = self._get_file_bytes(file_path)
+        if b"\n" in target:
+            return False
+        # Lines end in "\n" or "\r\n", as LineTable splits them; the first
+        # line lacks a leading newline and the last may lack a line ending;
+        # the empty remainder after a final newline is not a line
+        for line in (target + b"\n", target + b"\r\n"):
+            if data.find(b"\n" + line) != -1 or data.startswith(line):
+                return True
+        for line in (target, target + b"\r"):
+            if line and (data.endswith(b"\n" + line) or data == line):
                 return True
-            if sorted_lines[mid] < query:
-                low = mid + 1
-            else:
-                high = mid - 1
         return False
 
+    def get_cached_file_content(self) -> LineTable:
+        """Get cached file content, reading it again only when the file changes on disk."""
+        file_path = self.config.file_path
+        try:
+            stat = os.stat(file_path)
+            key = (file_path, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError as exc:
+            raise FileError("File not found: %s" % file_path) from exc
+        except OSError as e:
+            raise FileError("Error reading file %s: %s" %
+                            (file_path, e)) from e
+
+        # Lock-free fast path: the key is published after the content, so a
+        # matching key always pairs with the content read from that version
+        cached_key = self._cache_key
+        content = self.file_content
+        if content is not None and cached_key == key:
+            return content
+
+        with self._cache_lock:
+            if self.file_content is None or self._cache_key != key:
+                try:
+                    self._cache_key = None
+                    self.file_content = self.read_file(file_path)
+                    self._cache_key = key
+                except FileError as e:
+                    logger.error("Error caching file content: %s",
+                                 e, exc_info=True)
+                    raise
+            return self.file_content
+
+    def binary_search(self, sorted_lines: Sequence, query: bytes) -> bool:
+        """Perform binary search to determine if the query string exists in the sorted list."""
+        if isinstance(sorted_lines, LineTable):
+            # Answered from the table's own index, without slicing lines
+            return query in sorted_lines
+        index = bisect_left(sorted_lines, query)
+        return index != len(sorted_lines) and sorted_lines[index] == query
+
+
+def run_server(server: TCPServer, num_workers: int = 1) -> None:
+    """Run the server with the configured backend until interrupted."""
+    if num_workers > 1 and hasattr(os, 'fork'):
+        # Fork from the main thread while it is the only one running
+        server.start(num_workers)
+        print("Server shut down successfully.")
+        return
+
+    if server.config.use_asyncio:
+        try:
+            server.start()
+        except KeyboardInterrupt:
+            print("Server shut down successfully.")
+        return
+
+    # Bound on this thread, so a port already in use ends main() with an error
+    server_socket = server._listen()
+    server_thread = threading.Thread(target=server._serve, args=(server_socket,))
+    server_thread.start()
+
+    # Keep the main thread running
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("Shutting down the server...")
+        server.shutdown()
+        server_thread.join()
+        print("Server shut down successfully.")
+
 
 def main():
     """Main function to set up and run the server."""
     try:
         config = ServerConfig('config.ini')
+        # Created before forking so all workers share one SSL context, and
+        # with it the session ticket keys, letting any worker resume a session
         server = TCPServer(config)
-        server_thread = threading.Thread(target=server.start)
-        server_thread.start()
-
-        # Keep the main thread running
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            print("Shutting down the server...")
-            server.shutdown()
-            server_thread.join()
-            print("Server shut down successfully.")
+        # One process per core sidesteps the GIL
+        run_server(server, os.cpu_count() or 1)
     except ConfigError as e:
         logger.critical("Configuration error: %s", e, exc_info=True)
         sys.exit(1)
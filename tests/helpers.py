@@ -0,0 +1,43 @@
+"""
+Helpers shared by the server and client test modules.
+"""
+
+import socket
+import time
+
+
+def connect_with_retry(host='localhost', port=44445, retries=10, delay=0.01):
+    """
+    Attempt to connect to the server, backing off exponentially between retries.
+
+    Args:
+        host (str): The server hostname.
+        port (int): The server port number.
+        retries (int): Number of retries.
+        delay (float): Initial delay between retries in seconds, doubled
+            after each attempt up to one second.
+
+    Returns:
+        socket: A connected socket object.
+
+    Raises:
+        socket.error: The last connection error if all retries fail.
+    """
+    for attempt in range(retries):
+        try:
+            return socket.create_connection((host, port), timeout=5)
+        except socket.error:
+            if attempt == retries - 1:
+                raise
+            time.sleep(min(1.0, delay * 2 ** attempt))  # Wait before retrying
+
+
+def recv_into_from(*chunks):
+    """Build a recv_into side effect that delivers the chunks, then end of stream."""
+    remaining = iter(chunks)
+
+    def recv_into(view):
+        chunk = next(remaining, b'')
+        view[:len(chunk)] = chunk
+        return len(chunk)
+    return recv_into
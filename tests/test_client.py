@@ -8,24 +8,44 @@ The tests cover the following functionalities:
 1. **SSL and Plain Socket Creation**:
    - `test_create_ssl_socket` verifies SSL socket creation and secure connection 
      to the server using a mock SSL context.
-   - `test_create_plain_socket` checks the creation of a plain socket and 
-     connection to the server without SSL.
+   - `test_create_plain_socket` checks the creation of a plain socket, its 
+     TCP options and connection to the server without SSL.
+   - `test_ssl_context_is_cached` ensures the client SSL context is built 
+     once and shared by later connections.
+   - `test_ssl_context_warmup_does_not_block_import` checks that importing 
+     the module builds no SSL context and that a warmup builds it in the 
+     background.
 
 2. **Server Connection**:
    - `test_connect_to_server` tests the connection logic to ensure it correctly 
      uses SSL or plain sockets based on the user's choice.
+   - `test_connect_to_server_plain_no_ssl_context` ensures plain connections 
+     never build an SSL context.
 
 3. **Query Handling**:
    - `test_send_query` confirms that queries are sent correctly and responses 
-     are received from the server.
+     are received from the server; `test_send_query_reads_until_newline` 
+     covers responses spread over several reads, and 
+     `test_send_query_into_buffer` a caller-supplied receive buffer.
    - `test_execute_query` measures the time taken to execute a query and receive 
      a response from the server.
+   - `test_execute_queries_pipelined` checks that a batch of queries is sent 
+     in one write and its responses are read back in order.
+   - `test_main_reuses_connection` verifies that several queries share a 
+     single pooled connection.
+   - `test_pool_reuses_released_connection` and 
+     `test_pool_discards_closed_connection` check that idle connections are 
+     handed out again only while the server keeps them open.
+   - `test_ssl_session_resumed_after_server_close` checks that the 
+     connection replacing one the server closed resumes its TLS session.
 
 4. **Error Handling**:
    - `test_custom_connection_error` checks that custom connection errors are 
      raised and handled properly.
    - `test_create_ssl_socket_error` and `test_create_plain_socket_error` ensure 
      the module raises appropriate exceptions when socket creation fails.
+   - `test_create_plain_socket_timeout` checks that an unresponsive server 
+     raises instead of hanging.
    - `test_send_query_error` validates the error handling when sending a query 
      fails.
 
@@ -35,23 +55,40 @@ functions.
 """
 
 from unittest.mock import patch, MagicMock
+import importlib.util
+import select
 import socket
 import ssl
+import threading
+import time
 import pytest
+import client
+from tests.helpers import recv_into_from
 from client import (
+    acquire_connection,
+    release_connection,
     create_ssl_socket,
     create_plain_socket,
     connect_to_server,
     send_query,
     execute_query,
+    execute_queries,
+    main,
+    _get_ssl_context,
     CustomConnectionError,
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_socket():
-    """Fixture to create a mock socket."""
-    return MagicMock(spec=socket.socket)
+    """Fixture to create a mock socket shared by the module's tests."""
+    return MagicMock(spec_set=socket.socket)
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_socket(mock_socket):
+    """Fixture to clear the shared mock socket's calls and behaviour before each test."""
+    mock_socket.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
@@ -64,23 +101,66 @@ def mock_ssl_context():
 
 def test_create_ssl_socket(mock_socket, mock_ssl_context):
     """Test SSL socket creation and connection."""
-    with patch('socket.socket', return_value=mock_socket), \
-            patch('ssl.create_default_context', return_value=mock_ssl_context):
+    with patch('socket.create_connection', return_value=mock_socket) as mock_connect, \
+            patch('client.prewarm_ssl_context'), \
+            patch('client._get_ssl_context', return_value=mock_ssl_context), \
+            patch.dict('client._SSL_SESSIONS', clear=True):
         result = create_ssl_socket('example.com', 443)
 
     assert result == mock_ssl_context.wrap_socket.return_value
+    mock_connect.assert_called_once_with(('example.com', 443), timeout=5.0)
+    mock_ssl_context.wrap_socket.assert_called_once_with(
+        mock_socket, server_hostname='example.com', session=None)
+
+
+def test_ssl_context_is_cached(mock_ssl_context):
+    """Test that the client SSL context is built once and then reused."""
+    with patch.dict('client._SSL_CTX_CACHE', clear=True), \
+            patch('ssl.create_default_context', return_value=mock_ssl_context) as mock_create:
+        first = _get_ssl_context()
+        second = _get_ssl_context()
+
+    assert first is second is mock_ssl_context
+    mock_create.assert_called_once()
     mock_ssl_context.load_verify_locations.assert_called_once_with('cert.pem')
-    mock_ssl_context.wrap_socket.assert_called_once()
-    result.connect.assert_called_once_with(('example.com', 443))
+
+
+def test_ssl_context_warmup_does_not_block_import(mock_ssl_context):
+    """Test that import builds no SSL context and warmup builds it off-thread."""
+    release = threading.Event()
+
+    def slow_create_default_context(purpose):
+        release.wait(5)
+        return mock_ssl_context
+
+    with patch('ssl.create_default_context',
+               side_effect=slow_create_default_context) as mock_create:
+        spec = importlib.util.spec_from_file_location('fresh_client', client.__file__)
+        fresh_client = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(fresh_client)
+        mock_create.assert_not_called()
+
+        started = time.monotonic()
+        fresh_client.prewarm_ssl_context()
+        assert time.monotonic() - started < 1.0
+        assert not fresh_client._SSL_CTX_CACHE
+
+        release.set()
+        assert fresh_client._get_ssl_context() is mock_ssl_context
+    mock_create.assert_called_once()
 
 
 def test_create_plain_socket(mock_socket):
     """Test plain socket creation and connection."""
-    with patch('socket.socket', return_value=mock_socket):
+    with patch('socket.create_connection', return_value=mock_socket) as mock_connect:
         result = create_plain_socket('example.com', 80)
 
     assert result == mock_socket
-    mock_socket.connect.assert_called_once_with(('example.com', 80))
+    mock_connect.assert_called_once_with(('example.com', 80), timeout=5.0)
+    mock_socket.setsockopt.assert_any_call(
+        socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    mock_socket.setsockopt.assert_any_call(
+        socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
 
 
 @pytest.mark.parametrize("use_ssl,expected_function", [
@@ -96,28 +176,110 @@ def test_connect_to_server(use_ssl, expected_function):
     mock_func.assert_called_once_with('example.com', 443)
 
 
+def test_connect_to_server_plain_no_ssl_context(mock_socket):
+    """Test that a plain connection does no SSL setup."""
+    with patch('socket.create_connection', return_value=mock_socket), \
+            patch('ssl.create_default_context') as mock_create_context, \
+            patch.dict('client._SSL_CTX_CACHE', clear=True):
+        result = connect_to_server(False, 'example.com', 44445)
+
+    assert result == mock_socket
+    mock_create_context.assert_not_called()
+
+
 def test_send_query(mock_socket):
     """Test sending a query to the server and receiving a response."""
-    mock_socket.recv.return_value = b'Server response'
+    mock_socket.recv_into.side_effect = recv_into_from(b'Server response\n')
 
     result = send_query(mock_socket, 'Test query')
 
-    assert result == 'Server response'
-    mock_socket.sendall.assert_called_once_with(b'Test query')
-    mock_socket.recv.assert_called_once_with(1024)
+    assert result == 'Server response\n'
+    mock_socket.sendall.assert_called_once_with(b'Test query\n')
+    mock_socket.recv_into.assert_called_once()
+
+
+def test_send_query_into_buffer(mock_socket):
+    """Test that a caller-supplied buffer receives the response."""
+    mock_socket.recv_into.side_effect = recv_into_from(b'Server response\n')
+    buf = bytearray(64)
+
+    result = send_query(mock_socket, 'Test query', buf)
+
+    assert result == 'Server response\n'
+    assert buf.startswith(b'Server response\n')
+
+
+def test_recv_buffer_is_per_thread():
+    """Test that each thread reuses its own receive buffer."""
+    buffers = []
+    worker = threading.Thread(target=lambda: buffers.append(client._recv_buffer()))
+    worker.start()
+    worker.join()
+
+    assert client._recv_buffer() is client._recv_buffer()
+    assert buffers[0] is not client._recv_buffer()
+
+
+def test_send_query_reads_until_newline(mock_socket):
+    """Test that a response split across segments is returned whole."""
+    long_line = b'x' * 5000
+    mock_socket.recv_into.side_effect = recv_into_from(
+        long_line[:4096], long_line[4096:], b'\n')
+
+    result = send_query(mock_socket, 'Test query')
+
+    assert result == long_line.decode() + '\n'
+    assert mock_socket.recv_into.call_count == 3
+    if client._TCP_QUICKACK is not None:
+        # Quick-ACK mode does not persist on Linux, so every read re-arms it
+        assert mock_socket.setsockopt.call_count == 3
+        mock_socket.setsockopt.assert_called_with(
+            socket.IPPROTO_TCP, client._TCP_QUICKACK, 1)
+
+
+def test_send_query_server_closed(mock_socket):
+    """Test that an empty read is reported as a closed connection."""
+    mock_socket.recv_into.side_effect = recv_into_from()
+
+    with pytest.raises(CustomConnectionError, match="Server closed the connection"):
+        send_query(mock_socket, 'Test query')
 
 
 def test_execute_query(mock_socket):
     """Test executing a query and measuring the time taken."""
-    mock_socket.recv.return_value = b'Server response'
+    mock_socket.recv_into.side_effect = recv_into_from(b'Server response\n')
 
-    with patch('time.time', side_effect=[0, 1]):  # Simulate 1 second elapsed
+    with patch('time.perf_counter_ns', side_effect=[0, 1_000_000_000]):  # Simulate 1 second elapsed
         response, duration = execute_query(mock_socket, 'Test query')
 
-    assert response == 'Server response'
+    assert response == 'Server response\n'
     assert duration == 1.0
-    mock_socket.sendall.assert_called_once_with(b'Test query')
-    mock_socket.recv.assert_called_once_with(1024)
+    mock_socket.sendall.assert_called_once_with(b'Test query\n')
+    mock_socket.recv_into.assert_called_once()
+
+
+def test_execute_queries_pipelined(mock_socket):
+    """Test that a batch of queries costs a single write and a single read."""
+    queries = [f'query {i}' for i in range(10)]
+    mock_socket.recv_into.side_effect = recv_into_from(
+        b'STRING EXISTS\n' * 5 + b'STRING NOT FOUND\n' * 5)
+
+    with patch('time.perf_counter_ns', side_effect=[0] + [500_000_000] * 10):
+        results = execute_queries(mock_socket, queries)
+
+    mock_socket.sendall.assert_called_once_with(
+        '\n'.join(queries).encode('utf-8') + b'\n')
+    mock_socket.recv_into.assert_called_once()
+    assert results == ([('STRING EXISTS\n', 0.5)] * 5
+                       + [('STRING NOT FOUND\n', 0.5)] * 5)
+
+
+def test_execute_queries_server_closed(mock_socket):
+    """Test that a batch cut short by the server is reported."""
+    mock_socket.recv_into.side_effect = recv_into_from(b'STRING EXISTS\n')
+
+    with pytest.raises(CustomConnectionError, match="Server closed the connection"):
+        execute_queries(mock_socket, ['first', 'second'])
 
 
 def test_custom_connection_error():
@@ -128,21 +290,117 @@ def test_custom_connection_error():
 
 def test_create_ssl_socket_error():
     """Test error handling when SSL socket creation fails."""
-    with patch('socket.socket', side_effect=socket.error("Test error")):
+    with patch('socket.create_connection', side_effect=socket.error("Test error")), \
+            patch('client.prewarm_ssl_context'):
         with pytest.raises(CustomConnectionError, match="Failed to create or connect SSL socket"):
             create_ssl_socket('example.com', 443)
 
 
 def test_create_plain_socket_error():
     """Test error handling when plain socket creation fails."""
-    with patch('socket.socket', side_effect=OSError("Test error")):
+    with patch('socket.create_connection', side_effect=OSError("Test error")):
         with pytest.raises(CustomConnectionError, match="Failed to create or connect plain socket"):
             create_plain_socket('example.com', 80)
 
 
+def test_create_plain_socket_timeout():
+    """Test that a server which never answers fails the query within the timeout."""
+    with socket.create_server(('127.0.0.1', 0)) as listener, \
+            patch('client.SOCKET_TIMEOUT', 0.2):
+        sock = create_plain_socket('127.0.0.1', listener.getsockname()[1])
+        with sock:
+            started = time.monotonic()
+            with pytest.raises(CustomConnectionError, match="timed out"):
+                send_query(sock, 'Test query')
+            assert time.monotonic() - started < 5.0
+
+
 def test_send_query_error(mock_socket):
     """Test error handling when sending a query fails."""
     mock_socket.sendall.side_effect = socket.error("Test error")
 
     with pytest.raises(CustomConnectionError, match="Error during communication with server"):
         send_query(mock_socket, 'Test query')
+
+
+def test_main_reuses_connection(mock_socket):
+    """Test that all queries share one connection."""
+    mock_socket.recv_into.side_effect = recv_into_from(*[b'STRING EXISTS\n'] * 3)
+
+    with patch('client.connect_to_server', return_value=mock_socket) as mock_connect, \
+            patch('select.select', return_value=([], [], [])), \
+            patch.dict('client._CONN_POOL', clear=True):
+        main('example.com', 44445, False, ['first', 'second', 'third'])
+
+    mock_connect.assert_called_once_with(False, 'example.com', 44445)
+    assert mock_socket.sendall.call_count == 3
+    mock_socket.close.assert_called_once()
+
+
+def test_pool_reuses_released_connection():
+    """Test that a released idle connection is handed out again."""
+    sock, peer = socket.socketpair()
+    try:
+        with patch('client.connect_to_server') as mock_connect, \
+                patch.dict('client._CONN_POOL', clear=True):
+            release_connection(sock, False, 'example.com', 44445)
+            assert acquire_connection(False, 'example.com', 44445) is sock
+        mock_connect.assert_not_called()
+    finally:
+        sock.close()
+        peer.close()
+
+
+def test_pool_discards_closed_connection():
+    """Test that a pooled connection closed by the server is replaced."""
+    sock, peer = socket.socketpair()
+    peer.close()
+    fresh = MagicMock(spec=socket.socket)
+    with patch('client.connect_to_server', return_value=fresh) as mock_connect, \
+            patch.dict('client._CONN_POOL', clear=True):
+        release_connection(sock, False, 'example.com', 44445)
+        assert acquire_connection(False, 'example.com', 44445) is fresh
+    mock_connect.assert_called_once_with(False, 'example.com', 44445)
+    assert sock.fileno() == -1
+
+
+def test_ssl_session_resumed_after_server_close():
+    """Test that reconnecting after the server closes a connection resumes its TLS session."""
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(certfile='cert.pem', keyfile='key.pem')
+    client_context = ssl.create_default_context()
+    client_context.check_hostname = False
+    client_context.verify_mode = ssl.CERT_NONE
+
+    with socket.create_server(('localhost', 0)) as listener:
+        port = listener.getsockname()[1]
+
+        def serve():
+            # Answer one query per connection, then close it as an idle one would be
+            for _ in range(2):
+                conn, _ = listener.accept()
+                with server_context.wrap_socket(conn, server_side=True) as tls_socket:
+                    tls_socket.recv(1024)
+                    tls_socket.sendall(b'STRING EXISTS\n')
+
+        server_thread = threading.Thread(target=serve)
+        server_thread.start()
+        reused = []
+        try:
+            with patch('client._get_ssl_context', return_value=client_context), \
+                    patch('client.prewarm_ssl_context'), \
+                    patch.dict('client._SSL_SESSIONS', clear=True), \
+                    patch.dict('client._CONN_POOL', clear=True):
+                for _ in range(2):
+                    sock = acquire_connection(True, 'localhost', port)
+                    assert send_query(sock, 'apple') == 'STRING EXISTS\n'
+                    reused.append(sock.session_reused)
+                    release_connection(sock, True, 'localhost', port)
+                    # Wait for the server's close so the pool discards the connection
+                    sock.settimeout(5)
+                    select.select([sock], [], [], 5)
+                client.close_pooled_connections()
+        finally:
+            server_thread.join(timeout=5)
+
+    assert reused == [False, True]
@@ -16,8 +16,10 @@ import threading
 import time
 import socket
 import ssl
+from collections.abc import Sequence
 import pytest
 from server import ServerConfig, TCPServer, ServerError
+from tests.helpers import connect_with_retry
 
 
 @pytest.fixture
@@ -69,7 +71,7 @@ def test_read_file(tcp_server_fixture: TCPServer) -> None:
     tcp_server_fixture.file_content = None  # Reset cache
     # Ensure 'file_path' points to a valid temporary or mock file
     content = tcp_server_fixture.read_file(tcp_server_fixture.config.file_path)
-    assert isinstance(content, list)
+    assert isinstance(content, Sequence)
     assert len(content) > 0  # Assuming the file is not empty
 
 
@@ -133,36 +135,9 @@ def test_server_start_and_accept(tcp_server_fixture: TCPServer) -> None:
     server_thread.daemon = True  # Set as daemon thread for automatic termination
     server_thread.start()
 
-    def connect_with_retry(host, port, retries=5, delay=1):
-        """
-        Attempt to connect to the server with a retry mechanism.
-
-        Args:
-            host (str): The server hostname.
-            port (int): The server port number.
-            retries (int): Number of retries.
-            delay (int): Delay between retries in seconds.
-
-        Returns:
-            socket: A connected socket object.
-
-        Raises:
-            pytest.fail: If connection fails after all retries.
-        """
-        last_exception = None
-        for _ in range(retries):
-            try:
-                sock = socket.create_connection((host, port), timeout=5)
-                return sock
-            except socket.error as e:
-                last_exception = e
-                time.sleep(delay)  # Wait before retrying
-        pytest.fail(f"Unable to connect to the server after {
-                    retries} attempts: {last_exception}")
-
     try:
         # Try to connect with retry logic
-        client_socket = connect_with_retry('localhost', 44445)
+        client_socket = connect_with_retry()
 
         # Test multiple queries
         for _ in range(3):
@@ -4,12 +4,20 @@ This module implements a TCP server that can use SSL for secure communication
 and performs binary search on a sorted file to find queried strings. It includes
 comprehensive error handling for improved reliability and debugging.
 """
+import asyncio
+import logging
+import multiprocessing
+import os
 import threading
 import time
 import socket
+import ssl
 from unittest.mock import patch, MagicMock
+from collections.abc import Sequence
 import pytest
-from server import ServerConfig, TCPServer, ConfigError, FileError
+from server import (ServerConfig, TCPServer, LineTable, ConfigError, FileError,
+                    ServerError, _RESP_YES, _RESP_NO)
+from tests.helpers import connect_with_retry, recv_into_from
 
 
 @pytest.fixture
@@ -66,6 +74,8 @@ def test_read_config(server_config_fixture: ServerConfig) -> None:
     assert server_config_fixture.file_path == './200k.txt'
     assert server_config_fixture.reread_on_query is False
     assert server_config_fixture.use_ssl is True
+    with pytest.raises(AttributeError):
+        server_config_fixture.use_sll = False  # Slots reject misspelt settings
 
 
 def test_read_file(tcp_server_fixture: TCPServer, sample_data_file) -> None:
@@ -78,9 +88,20 @@ def test_read_file(tcp_server_fixture: TCPServer, sample_data_file) -> None:
     """
     tcp_server_fixture.config.file_path = sample_data_file
     content = tcp_server_fixture.read_file(tcp_server_fixture.config.file_path)
-    assert isinstance(content, list)
+    assert isinstance(content, Sequence)
     assert len(content) == 5
-    assert content == ["apple", "banana", "cherry", "date", "elderberry"]
+    assert list(content) == [b"apple", b"banana", b"cherry", b"date", b"elderberry"]
+    assert b"cherry" in content
+
+
+def test_read_file_survives_truncation(tcp_server_fixture: TCPServer,
+                                       sample_data_file) -> None:
+    """Test that a table keeps answering after its file is truncated in place."""
+    table = tcp_server_fixture.read_file(sample_data_file)
+    with open(sample_data_file, 'wb'):
+        pass
+    assert b"cherry" in table
+    assert table.respond(b"cherry", b"yes", b"no") == b"yes"
 
 
 def test_cached_file_content(tcp_server_fixture: TCPServer, sample_data_file) -> None:
@@ -95,8 +116,44 @@ def test_cached_file_content(tcp_server_fixture: TCPServer, sample_data_file) ->
     tcp_server_fixture.file_content = None  # Reset cache
     cached_content = tcp_server_fixture.get_cached_file_content()
     assert tcp_server_fixture.file_content is not None
-    assert cached_content == [
-        "apple", "banana", "cherry", "date", "elderberry"]
+    assert list(cached_content) == [
+        b"apple", b"banana", b"cherry", b"date", b"elderberry"]
+
+
+def test_cached_file_content_reloads_on_change(tcp_server_fixture: TCPServer,
+                                               sample_data_file) -> None:
+    """Test that the cache is reused until the file's mtime changes."""
+    tcp_server_fixture.config.file_path = sample_data_file
+    first = tcp_server_fixture.get_cached_file_content()
+    assert tcp_server_fixture.get_cached_file_content() is first
+
+    stat = os.stat(sample_data_file)
+    with open(sample_data_file, 'a', encoding='utf-8') as file:
+        file.write("\nfig")
+    os.utime(sample_data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = tcp_server_fixture.get_cached_file_content()
+    assert reloaded is not first
+    assert b"fig" in reloaded
+
+
+def test_cached_file_content_survives_touch(tcp_server_fixture: TCPServer,
+                                            sample_data_file) -> None:
+    """Test that touching the file without changing mtime or size does not re-parse it."""
+    tcp_server_fixture.config.file_path = sample_data_file
+    first = tcp_server_fixture.get_cached_file_content()
+
+    stat = os.stat(sample_data_file)
+    os.utime(sample_data_file, ns=(stat.st_atime_ns + 1_000_000, stat.st_mtime_ns))
+    with patch.object(tcp_server_fixture, 'read_file') as mock_read:
+        assert tcp_server_fixture.get_cached_file_content() is first
+    mock_read.assert_not_called()
+
+    # A same-mtime rewrite that changes the size is still picked up
+    with open(sample_data_file, 'a', encoding='utf-8') as file:
+        file.write("\nfig")
+    os.utime(sample_data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert b"fig" in tcp_server_fixture.get_cached_file_content()
 
 
 def test_binary_search(tcp_server_fixture: TCPServer) -> None:
@@ -114,26 +171,100 @@ def test_binary_search(tcp_server_fixture: TCPServer) -> None:
     assert tcp_server_fixture.binary_search(sorted_lines, 'omega') is False
 
 
+def test_binary_search_line_table(tcp_server_fixture: TCPServer) -> None:
+    """Test that a LineTable is searched through its own membership test."""
+    table = LineTable(b"delta\nalpha\ngamma\n")
+    assert tcp_server_fixture.binary_search(table, b"alpha") is True
+    assert tcp_server_fixture.binary_search(table, b"gamma") is True
+    assert tcp_server_fixture.binary_search(table, b"beta") is False
+    assert tcp_server_fixture.binary_search(table, b"zeta") is False
+
+
+def test_line_table() -> None:
+    """Test the sorted offset table built over a raw file buffer."""
+    table = LineTable(b"pear\r\napple\n\nfig\nbanana")
+    assert len(table) == 5
+    assert list(table) == [b"", b"apple", b"banana", b"fig", b"pear"]
+    assert table[1:3] == [b"apple", b"banana"]
+    assert b"pear" in table
+    assert b"banana" in table
+    assert b"pea" not in table
+    assert b"zucchini" not in table
+    assert b"p" not in table
+    assert len(LineTable(b"")) == 0
+    # The compiled index replaces the fingerprint index when search_ext is built
+    with patch('server.search_ext', MagicMock()) as mock_search_ext:
+        compiled = LineTable(b"pear\r\napple\n\nfig\nbanana")
+    mock_search_ext.LineIndex.assert_called_once_with(
+        compiled._buffer, compiled._starts, compiled._ends)
+    assert compiled._fingerprints is None
+    assert compiled.respond(b"fig", b"yes", b"no") is (
+        mock_search_ext.LineIndex.return_value.respond.return_value)
+
+
 @patch('ssl.create_default_context')
-def test_ssl_wrap_socket(mock_create_context, tcp_server_fixture: TCPServer) -> None:
+def test_ssl_wrap_socket(mock_create_context, server_config_fixture: ServerConfig) -> None:
     """
-    Test SSL wrapping of sockets.
+    Test SSL wrapping of sockets with a context built once per server.
 
     Args:
         mock_create_context: Mocked SSL context creation.
-        tcp_server_fixture (TCPServer): The initialized TCP server object.
+        server_config_fixture (ServerConfig): The server configuration object.
     """
     mock_context = MagicMock()
     mock_create_context.return_value = mock_context
     mock_wrapped_socket = MagicMock()
     mock_context.wrap_socket.return_value = mock_wrapped_socket
 
-    tcp_server_fixture.config.use_ssl = True  # Enable SSL for the test
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as client_socket:
-        wrapped_socket = tcp_server_fixture.wrap_socket_with_ssl(client_socket)
-        assert wrapped_socket == mock_wrapped_socket
-        mock_context.load_cert_chain.assert_called_once_with(
-            certfile='cert.pem', keyfile='key.pem')
+    server_config_fixture.use_ssl = True  # Enable SSL for the test
+    tcp_server = TCPServer(server_config_fixture)
+    for _ in range(2):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as client_socket:
+            wrapped_socket = tcp_server.wrap_socket_with_ssl(client_socket)
+            assert wrapped_socket == mock_wrapped_socket
+
+    mock_create_context.assert_called_once()
+    mock_context.load_cert_chain.assert_called_once_with(
+        certfile='cert.pem', keyfile='key.pem')
+    assert mock_context.wrap_socket.call_count == 2
+
+
+def tls_handshake(server_context, client_context, session=None):
+    """Run one TLS handshake over a socket pair and return the client's session state."""
+    server_end, client_end = socket.socketpair()
+
+    def serve():
+        with server_context.wrap_socket(server_end, server_side=True) as tls_socket:
+            tls_socket.sendall(b"x")
+            tls_socket.recv(1)
+
+    server_thread = threading.Thread(target=serve)
+    server_thread.start()
+    with client_context.wrap_socket(client_end, server_hostname='localhost',
+                                    session=session) as tls_socket:
+        # Reading lets the client pick up TLS 1.3 session tickets
+        tls_socket.recv(1)
+        tls_socket.sendall(b"y")
+        result = tls_socket.session, tls_socket.session_reused
+    server_thread.join(timeout=5)
+    return result
+
+
+@pytest.mark.parametrize("version", [ssl.TLSVersion.TLSv1_2, ssl.TLSVersion.TLSv1_3])
+def test_ssl_session_resumption(server_config_fixture: ServerConfig, version):
+    """Test that a returning client resumes its TLS session on the shared context."""
+    server_config_fixture.use_ssl = True
+    server_context = TCPServer(server_config_fixture)._ssl_context
+    client_context = ssl.create_default_context()
+    client_context.check_hostname = False
+    client_context.verify_mode = ssl.CERT_NONE
+    client_context.maximum_version = version
+
+    session, reused = tls_handshake(server_context, client_context)
+    assert reused is False
+    _, reused = tls_handshake(server_context, client_context, session)
+    assert reused is True
+    assert server_context.session_stats()['hits'] == 1
 
 
 def test_config_error_handling():
@@ -169,9 +300,407 @@ def test_handle_client_with_invalid_data(tcp_server_fixture: TCPServer, sample_d
     tcp_server_fixture.config.file_path = sample_data_file
     mock_socket = MagicMock()
     # Send invalid data, then simulate connection close
-    mock_socket.recv.side_effect = [b'invalid\n', b'']
+    mock_socket.recv_into.side_effect = recv_into_from(b'invalid\n')
 
     tcp_server_fixture.handle_client(mock_socket)
 
     mock_socket.sendall.assert_called_once_with(b'STRING NOT FOUND\n')
     mock_socket.close.assert_called_once()
+
+
+def test_handle_client_with_valid_data(tcp_server_fixture: TCPServer, sample_data_file):
+    """Test that a cached lookup finds an existing line."""
+    tcp_server_fixture.config.file_path = sample_data_file
+    mock_socket = MagicMock()
+    mock_socket.recv_into.side_effect = recv_into_from(b'banana\n')
+
+    tcp_server_fixture.handle_client(mock_socket)
+
+    mock_socket.sendall.assert_called_once_with(b'STRING EXISTS\n')
+    assert b'banana' in tcp_server_fixture.file_content
+
+
+def test_build_response_reuses_constants(tcp_server_fixture: TCPServer, sample_data_file):
+    """Test that byte queries are answered with the shared response objects."""
+    tcp_server_fixture.config.file_path = sample_data_file
+    assert tcp_server_fixture.build_response(b'banana') is _RESP_YES
+    assert tcp_server_fixture.build_response(b'kiwi') is _RESP_NO
+    tcp_server_fixture.config.reread_on_query = True
+    assert tcp_server_fixture.build_response(b'banana') is _RESP_YES
+    assert tcp_server_fixture.build_response(b'kiwi') is _RESP_NO
+
+
+def test_handle_client_pipelined_queries(tcp_server_fixture: TCPServer, sample_data_file):
+    """Test that queries split across or sharing segments are answered per line."""
+    tcp_server_fixture.config.file_path = sample_data_file
+    mock_socket = MagicMock()
+    mock_socket.recv_into.side_effect = recv_into_from(
+        b'app', b'le\nfig\r', b'\ncherry')
+
+    tcp_server_fixture.handle_client(mock_socket)
+
+    assert [c.args[0] for c in mock_socket.sendall.call_args_list] == [
+        b'STRING EXISTS\n', b'STRING NOT FOUND\n', b'STRING EXISTS\n']
+
+
+def test_handle_client_rejects_overlong_query(tcp_server_fixture: TCPServer):
+    """Test that a query longer than the receive buffer closes the connection."""
+    mock_socket = MagicMock()
+    mock_socket.recv_into.side_effect = recv_into_from(b'a' * 8192)
+
+    tcp_server_fixture.handle_client(mock_socket)
+
+    mock_socket.sendall.assert_not_called()
+    mock_socket.close.assert_called_once()
+
+
+def test_search_file(tcp_server_fixture: TCPServer, sample_data_file):
+    """Test searching the raw file contents used by the reread path."""
+    search = tcp_server_fixture.search_file
+    assert search(sample_data_file, b'apple') is True
+    assert search(sample_data_file, b'cherry') is True
+    assert search(sample_data_file, b'elderberry') is True
+    assert search(sample_data_file, b'app') is False
+    assert search(sample_data_file, b'berry') is False
+    assert search(sample_data_file, b'apple\nbanana') is False
+
+    with open(sample_data_file, 'a', encoding='utf-8') as file:
+        file.write("\nfig")
+    assert search(sample_data_file, b'fig') is True
+
+    # A file rewritten in place is read again rather than searched through
+    # a stale mapping
+    with open(sample_data_file, 'wb') as file:
+        file.write(b"kiwi\n")
+    assert search(sample_data_file, b'kiwi') is True
+    assert search(sample_data_file, b'apple') is False
+
+    # CRLF line endings are matched like the cached table splits them
+    crlf_file = os.path.join(os.path.dirname(sample_data_file), "crlf.txt")
+    for content in (b"pear\r\napple\r\nfig\r\n", b"pear\r\n\r\nfig\r", b"fig\r\n"):
+        with open(crlf_file, 'wb') as file:
+            file.write(content)
+        expected = tcp_server_fixture.read_file(crlf_file)
+        for query in (b'pear', b'apple', b'fig', b'app', b''):
+            assert search(crlf_file, query) is (query in expected)
+    assert search(crlf_file, b'fig') is True
+
+    with pytest.raises(FileError):
+        search("non_existent_file.txt", b'apple')
+
+
+def test_ssl_context_allows_session_resumption(server_config_fixture: ServerConfig):
+    """Test that the shared SSL context keeps session tickets enabled."""
+    server_config_fixture.use_ssl = True
+    context = TCPServer(server_config_fixture)._ssl_context
+
+    assert context.minimum_version == ssl.TLSVersion.TLSv1_2
+    assert not context.options & ssl.OP_NO_TICKET
+
+
+def test_serve_async(tcp_server_fixture: TCPServer, sample_data_file, caplog):
+    """Test answering queries from the asyncio backend and shutting it down."""
+    caplog.set_level(logging.INFO, logger='server')
+    tcp_server_fixture.config.file_path = sample_data_file
+    tcp_server_fixture.config.use_ssl = False
+    server_thread = threading.Thread(
+        target=asyncio.run, args=(tcp_server_fixture.serve_async(),))
+    server_thread.start()
+
+    try:
+        client_socket = connect_with_retry()
+
+        with client_socket:
+            client_socket.sendall(b"cherry\n")
+            assert client_socket.recv(1024) == b"STRING EXISTS\n"
+            client_socket.sendall(b"fig\n")
+            assert client_socket.recv(1024) == b"STRING NOT FOUND\n"
+    finally:
+        tcp_server_fixture.shutdown()
+        server_thread.join(timeout=5)
+    assert not server_thread.is_alive(), "Event loop should stop after shutdown"
+    assert tcp_server_fixture._loop is None
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages.count("Server shutdown successfully.") == 1
+
+
+def test_shutdown_disconnects_idle_clients(tcp_server_fixture: TCPServer):
+    """Test that shutdown() promptly unblocks handlers waiting on idle clients."""
+    tcp_server_fixture.config.use_ssl = False
+    server_thread = threading.Thread(target=tcp_server_fixture.start)
+    server_thread.start()
+
+    client_socket = connect_with_retry()
+
+    with client_socket:
+        # Make sure the connection is being served before shutting down
+        client_socket.sendall(b"apple\n")
+        client_socket.recv(1024)
+
+        started = time.monotonic()
+        tcp_server_fixture.shutdown()
+        server_thread.join(timeout=5)
+
+        assert time.monotonic() - started < 1.0
+        assert not server_thread.is_alive()
+        assert client_socket.recv(1024) == b""
+
+
+def test_selector_loop_survives_connection_errors(tcp_server_fixture: TCPServer,
+                                                 sample_data_file) -> None:
+    """Test that a failure on one connection closes only that connection."""
+    tcp_server_fixture.config.file_path = sample_data_file
+    tcp_server_fixture.config.use_ssl = False
+    setsockopt = socket.socket.setsockopt
+    setup_failures = [OSError("setsockopt failed")]
+    request_failures = [ValueError("unexpected")]
+    process_requests = tcp_server_fixture.process_requests
+
+    def failing_setsockopt(sock, level, option, value):
+        if option == socket.SO_KEEPALIVE and setup_failures:
+            raise setup_failures.pop()
+        return setsockopt(sock, level, option, value)
+
+    def failing_process_requests(buffer):
+        if request_failures:
+            raise request_failures.pop()
+        return process_requests(buffer)
+
+    server_thread = threading.Thread(target=tcp_server_fixture.start)
+    with patch.object(socket.socket, 'setsockopt', failing_setsockopt), \
+            patch.object(tcp_server_fixture, 'process_requests', failing_process_requests):
+        server_thread.start()
+        try:
+            for _ in range(2):  # The setup, then the request, fails
+                with connect_with_retry() as client_socket:
+                    client_socket.sendall(b"apple\n")
+                    try:
+                        assert client_socket.recv(1024) == b""
+                    except ConnectionResetError:
+                        pass  # Closed with the query unread
+            with connect_with_retry() as client_socket:
+                client_socket.sendall(b"apple\n")
+                assert client_socket.recv(1024) == b"STRING EXISTS\n"
+        finally:
+            tcp_server_fixture.shutdown()
+            server_thread.join(timeout=5)
+    assert not server_thread.is_alive()
+    assert not setup_failures and not request_failures
+
+
+def test_second_server_fails_to_bind(tcp_server_fixture: TCPServer,
+                                     server_config_fixture: ServerConfig):
+    """Test that a second server on the same port fails instead of sharing it."""
+    tcp_server_fixture.config.use_ssl = False
+    server_thread = threading.Thread(target=tcp_server_fixture.start)
+    server_thread.start()
+    try:
+        connect_with_retry().close()  # The first server is listening
+        with pytest.raises(ServerError):
+            TCPServer(server_config_fixture).start()
+    finally:
+        tcp_server_fixture.shutdown()
+        server_thread.join(timeout=5)
+    assert not server_thread.is_alive()
+
+
+def test_process_requests(tcp_server_fixture: TCPServer, sample_data_file) -> None:
+    """Test that complete lines are answered and a partial one is kept."""
+    tcp_server_fixture.config.file_path = sample_data_file
+    buffer = bytearray(b"apple\r\nkiwi\nche")
+    assert tcp_server_fixture.process_requests(buffer) == (
+        b"STRING EXISTS\nSTRING NOT FOUND\n")
+    assert buffer == b"che"
+    buffer += b"rry\n"
+    assert tcp_server_fixture.process_requests(buffer) == b"STRING EXISTS\n"
+    assert buffer == b""
+
+
+def test_selector_loop_serves_concurrent_clients(tcp_server_fixture: TCPServer,
+                                                 sample_data_file) -> None:
+    """Test that one server thread interleaves several plain connections."""
+    tcp_server_fixture.config.file_path = sample_data_file
+    tcp_server_fixture.config.use_ssl = False
+    server_thread = threading.Thread(target=tcp_server_fixture.start)
+    server_thread.start()
+    try:
+        first = connect_with_retry()
+        second = socket.create_connection(('localhost', 44445), timeout=5)
+
+        with first, second:
+            first.sendall(b"app")
+            second.sendall(b"date\nkiwi\n")
+            first.sendall(b"le\n")
+            assert first.recv(1024) == b"STRING EXISTS\n"
+            response = b""
+            while response.count(b"\n") < 2:
+                response += second.recv(1024)
+            assert response == b"STRING EXISTS\nSTRING NOT FOUND\n"
+
+            # A final query without a newline is answered before closing
+            first.sendall(b"banana")
+            first.shutdown(socket.SHUT_WR)
+            assert first.recv(1024) == b"STRING EXISTS\n"
+            assert first.recv(1024) == b""
+    finally:
+        tcp_server_fixture.shutdown()
+        server_thread.join(timeout=5)
+    assert not server_thread.is_alive()
+
+
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning")
+@pytest.mark.parametrize("use_asyncio", [False, True])
+def test_server_workers_share_port(tcp_server_fixture: TCPServer, sample_data_file,
+                                   use_asyncio: bool) -> None:
+    """Test that queries succeed against forked workers sharing one listening socket."""
+    if not hasattr(os, 'fork'):
+        pytest.skip("fork is not available")
+    tcp_server_fixture.config.file_path = sample_data_file
+    tcp_server_fixture.config.use_ssl = False
+    tcp_server_fixture.config.use_asyncio = use_asyncio
+    server_thread = threading.Thread(target=tcp_server_fixture.start, args=(2,))
+    server_thread.start()
+    try:
+        for query, expected in [(b"apple", b"STRING EXISTS\n"),
+                                (b"kiwi", b"STRING NOT FOUND\n")] * 4:
+            client_socket = connect_with_retry()
+            with client_socket:
+                client_socket.sendall(query + b"\n")
+                assert client_socket.recv(1024) == expected
+    finally:
+        tcp_server_fixture.shutdown()
+        server_thread.join(timeout=10)
+    assert not server_thread.is_alive()
+    assert not multiprocessing.active_children()
+
+
+def test_search_ext_matches_bisect() -> None:
+    """Test that the compiled table search agrees with the bisect fallback."""
+    search_ext = pytest.importorskip("search_ext")
+    table = LineTable(b"pear\napple\n\nfig\nbanana\nfig\na\n\xff\n\xffz")
+    lines = list(table)
+    for query in (b"", b"apple", b"app", b"apples", b"fig", b"pear", b"zzz", b"\x00",
+                  b"a", b"ap", b"\xff", b"\xffz", b"\xff\xff"):
+        expected = query in lines
+        assert search_ext.binary_search(
+            table._buffer, table._starts, table._ends, query) is expected
+        assert (query in table) is expected
+        assert (memoryview(query) in table) is expected
+        for raw in (query, b" " + query + b"\r", memoryview(bytearray(query + b"\t"))):
+            assert table.respond(raw, b"yes", b"no") == (b"yes" if expected else b"no")
+
+
+def test_line_table_hash_index() -> None:
+    """Test the fingerprint index used when search_ext is not built."""
+    with patch('server.search_ext', None):
+        table = LineTable(b"pear\napple\nfig\napple\n\nfig")
+        # Every line shares one fingerprint, so lookups fall back to bisect
+        with patch('server._line_hash', lambda line: 7):
+            colliding = LineTable(b"pear\napple\nfig\napple")
+            for query in (b"apple", b"fig", b"pear"):
+                assert query in colliding
+            assert b"app" not in colliding
+
+    assert table._fingerprints is not None
+    assert len(table._fingerprints) == 4  # Distinct lines
+    assert colliding._fingerprints == {7: -1}
+    for query in (b"apple", b"fig", b"pear", b""):
+        assert query in table
+    assert b"app" not in table
+    assert b"kiwi" not in table
+
+
+def test_line_table_respond() -> None:
+    """Test that raw query lines are stripped before the lookup."""
+    table = LineTable(b"pear\napple\nfig")
+    assert table.respond(b"apple", b"yes", b"no") == b"yes"
+    assert table.respond(memoryview(b" fig\r"), b"yes", b"no") == b"yes"
+    assert table.respond(b"app", b"yes", b"no") == b"no"
+    assert table.respond(b"", b"yes", b"no") == b"no"
+
+
+def test_shutdown_gives_up_on_stuck_handlers(tcp_server_fixture: TCPServer):
+    """Test that shutdown() waits for open connections only up to its timeout."""
+    stuck_socket = MagicMock()
+    with tcp_server_fixture._client_lock:
+        tcp_server_fixture._client_sockets.add(stuck_socket)
+        tcp_server_fixture._clients_drained.clear()
+
+    with patch('server.SHUTDOWN_TIMEOUT', 0.1):
+        started = time.monotonic()
+        tcp_server_fixture.shutdown()
+
+    assert time.monotonic() - started < 1.0
+    stuck_socket.shutdown.assert_called_once_with(socket.SHUT_RDWR)
+
+
+def tls_client_context() -> ssl.SSLContext:
+    """Build a client context that accepts the server's self-signed certificate."""
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def test_shutdown_drops_queued_tls_clients(server_config_fixture: ServerConfig,
+                                           sample_data_file):
+    """Test that a TLS connection still queued for the pool cannot outlive shutdown()."""
+    server_config_fixture.file_path = sample_data_file
+    server_config_fixture.use_ssl = True
+    with patch('server.MAX_CLIENT_WORKERS', 1):
+        tcp_server = TCPServer(server_config_fixture)
+    server_thread = threading.Thread(target=tcp_server.start)
+    server_thread.start()
+
+    served = tls_client_context().wrap_socket(connect_with_retry())
+    silent = connect_with_retry()  # Queued behind the only worker, never handshakes
+    with served, silent:
+        served.sendall(b"apple\n")
+        assert served.recv(1024) == b"STRING EXISTS\n"
+
+        tcp_server.shutdown()
+        server_thread.join(timeout=5)
+        for worker in list(tcp_server._pool._threads):
+            worker.join(timeout=5)
+            assert not worker.is_alive(), "Pool worker should not wait on a handshake"
+    assert not server_thread.is_alive()
+
+
+def test_tls_handler_skips_handshake_after_shutdown(tcp_server_fixture: TCPServer):
+    """Test that a TLS handler that starts after shutdown() closes its socket at once."""
+    tcp_server_fixture.stop_event.set()
+    client_socket = MagicMock()
+    with patch.object(tcp_server_fixture, 'wrap_socket_with_ssl') as mock_wrap:
+        tcp_server_fixture._handle_tls_client(client_socket)
+
+    mock_wrap.assert_not_called()
+    client_socket.close.assert_called_once()
+    assert not tcp_server_fixture._client_sockets
+
+
+def test_idle_tls_clients_cannot_starve_the_pool(server_config_fixture: ServerConfig,
+                                                 sample_data_file):
+    """Test that a client is served while every pool worker holds an idle connection."""
+    server_config_fixture.file_path = sample_data_file
+    server_config_fixture.use_ssl = True
+    with patch('server.MAX_CLIENT_WORKERS', 2), patch('server.CLIENT_IDLE_TIMEOUT', 0.2):
+        tcp_server = TCPServer(server_config_fixture)
+        server_thread = threading.Thread(target=tcp_server.start)
+        server_thread.start()
+        context = tls_client_context()
+        try:
+            idle = [context.wrap_socket(connect_with_retry()) for _ in range(2)]
+            for client_socket in idle:
+                client_socket.sendall(b"apple\n")
+                assert client_socket.recv(1024) == b"STRING EXISTS\n"
+
+            with context.wrap_socket(connect_with_retry()) as client_socket:
+                client_socket.sendall(b"cherry\n")
+                assert client_socket.recv(1024) == b"STRING EXISTS\n"
+            for client_socket in idle:
+                assert client_socket.recv(1024) == b""  # Closed once idle
+                client_socket.close()
+        finally:
+            tcp_server.shutdown()
+            server_thread.join(timeout=5)
+    assert not server_thread.is_alive()